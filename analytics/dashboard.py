@@ -10,13 +10,33 @@ import generate_heatmaps as gh
 import generate_mock_data as gm
 
 
-def create_full_dashboard():
-    """Create a comprehensive dashboard with all visualizations."""
+# Key statistics shown in the dashboard, stored column-wise
+STATS_LABELS = (
+    'Avg Accuracy',
+    'Web Search Success Rate',
+    'Avg Response Time',
+    'Total Claims Analyzed',
+    'Multi-Search Coverage',
+    'Unverifiable Rate',
+)
+STATS_VALUES = ('92.4%', '94.8%', '1.8s', '12,847', '96.2%', '6.3%')
+
+
+def create_full_dashboard(emit_png=False, data=None):
+    """
+    Create a comprehensive dashboard with all visualizations.
+    data is the dict returned by gm.save_all_data(); without it the CSVs are read.
+    """
     
     # Load all data
-    veracity_df = pd.read_csv('analytics/output/veracity_performance.csv', index_col=0)
-    multi_search_df = pd.read_csv('analytics/output/multi_search_effectiveness.csv')
-    response_df = pd.read_csv('analytics/output/response_times.csv')
+    if data is not None:
+        veracity_pct = gh.veracity_pct(data['veracity'])
+        multi_search_df = data['multi']
+        response_df = data['response']
+    else:
+        veracity_pct = gh.veracity_pct()
+        multi_search_df = gh._load_csv('analytics/output/multi_search_effectiveness.csv')
+        response_df = gh._load_csv('analytics/output/response_times.csv')
     
     # Create subplots
     fig = make_subplots(
@@ -28,11 +48,10 @@ def create_full_dashboard():
             'Key Statistics',
         ),
         specs=[[{"type": "heatmap"}, {"type": "scatter"}],
-               [{"type": "heatmap"}, {"type": "table"}]]
+               [{"type": "heatmap"}, {"type": "xy"}]]
     )
     
     # Plot 1: Veracity Performance
-    veracity_pct = (veracity_df * 100).round(1)
     fig.add_trace(
         go.Heatmap(
             z=veracity_pct.values,
@@ -48,7 +67,7 @@ def create_full_dashboard():
     
     # Plot 2: Multi-Search Effectiveness
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=multi_search_df['searches'],
             y=multi_search_df['accuracy']*100,
             mode='lines+markers',
@@ -58,7 +77,7 @@ def create_full_dashboard():
         row=1, col=2
     )
     fig.add_trace(
-        go.Scatter(
+        go.Scattergl(
             x=multi_search_df['searches'],
             y=multi_search_df['coverage']*100,
             mode='lines+markers',
@@ -69,12 +88,9 @@ def create_full_dashboard():
     )
     
     # Plot 3: Response Times
-    heatmap_data = {
-        'Average': response_df['avg_response_time'].tolist(),
-        '95th Percentile': response_df['p95_response_time'].tolist()
-    }
-    heatmap_df = pd.DataFrame(heatmap_data, 
-                              index=[f"{c} claim{'s' if c > 1 else ''}" for c in response_df['claims']])
+    heatmap_df = pd.DataFrame(response_df[['avg_response_time', 'p95_response_time']].to_numpy(),
+                              index=[f"{c} claim{'s' if c > 1 else ''}" for c in response_df['claims']],
+                              columns=['Average', '95th Percentile'])
     
     fig.add_trace(
         go.Heatmap(
@@ -87,30 +103,18 @@ def create_full_dashboard():
         row=2, col=1
     )
     
-    # Plot 4: Key Statistics Table
-    stats = [
-        ['Avg Accuracy', '92.4%'],
-        ['Web Search Success Rate', '94.8%'],
-        ['Avg Response Time', '1.8s'],
-        ['Total Claims Analyzed', '12,847'],
-        ['Multi-Search Coverage', '96.2%'],
-        ['Unverifiable Rate', '6.3%']
-    ]
-    
-    fig.add_trace(
-        go.Table(
-            header=dict(values=['Metric', 'Value'],
-                       fill_color='paleturquoise',
-                       align='left',
-                       font=dict(size=12, color='black')),
-            cells=dict(values=[[row[0] for row in stats],
-                             [row[1] for row in stats]],
-                      fill_color='lavender',
-                      align='left',
-                      font=dict(size=11))
-        ),
+    # Plot 4: Key Statistics (plain annotation; plotly.js Table traces render slowly)
+    fig.add_annotation(
+        text="<br>".join(f"<b>{label}</b>: {value}" for label, value in zip(STATS_LABELS, STATS_VALUES)),
+        xref="x domain", yref="y domain",
+        x=0.5, y=0.5,
+        showarrow=False,
+        align='left',
+        font=dict(size=13),
         row=2, col=2
     )
+    fig.update_xaxes(visible=False, row=2, col=2)
+    fig.update_yaxes(visible=False, row=2, col=2)
     
     # Update layout
     fig.update_layout(
@@ -132,19 +136,21 @@ def create_full_dashboard():
     fig.update_yaxes(title_text="Time Metric", row=2, col=1)
     
     # Save
-    fig.write_html('analytics/output/full_dashboard.html')
-    fig.write_image('analytics/output/full_dashboard.png', scale=2)
-    
-    print("[OK] Generated: full_dashboard.html/png")
+    gh._write(fig, 'analytics/output/full_dashboard', emit_png=emit_png)
+    if emit_png:
+        print("[OK] Generated: full_dashboard.html/png")
+    else:
+        print("[OK] Generated: full_dashboard.html")
 
 
 if __name__ == '__main__':
     # Generate data first if needed
     import os
+    data = None
     if not os.path.exists('analytics/output/veracity_performance.csv'):
-        gm.save_all_data()
+        data = gm.save_all_data()
     
-    create_full_dashboard()
+    create_full_dashboard(emit_png=gh.png_requested(), data=data)
     print("\n[DONE] Dashboard created successfully!")
     print("Open analytics/output/full_dashboard.html in your browser.")
 
@@ -3,21 +3,104 @@ Generate interactive heatmaps for UniteSocial AI visualization.
 Uses Plotly for publication-ready visualizations.
 """
 
+import argparse
+import os
+from functools import lru_cache
+
 import plotly.graph_objects as go
-import plotly.express as px
+import plotly.io as pio
 import pandas as pd
 import numpy as np
 
 
-def create_veracity_performance_heatmap():
+@lru_cache(maxsize=32)
+def _load_csv_raw(path, index_col, parse_dates):
+    try:
+        # Arrow's multithreaded reader; numpy-backed dtypes keep Plotly input unchanged
+        return pd.read_csv(path, index_col=index_col, parse_dates=parse_dates, engine='pyarrow')
+    except (ImportError, ValueError):
+        # pyarrow not installed or option not supported by its reader
+        return pd.read_csv(path, index_col=index_col, parse_dates=parse_dates)
+
+
+def _load_csv(path, index_col=None, parse_dates=False):
+    """
+    Load a CSV once per process and hand out copies.
+    The dashboard and the heatmaps read the same files, so parsing is shared.
+    """
+    return _load_csv_raw(path, index_col, parse_dates).copy()
+
+
+@lru_cache(maxsize=1)
+def _veracity_pct_raw():
+    return (_load_csv('analytics/output/veracity_performance.csv', index_col=0) * 100).round(1)
+
+
+def veracity_pct(df=None):
+    """
+    Veracity performance matrix as rounded percentages, shared with the dashboard.
+    Uses the given frame when supplied, otherwise the cached CSV.
+    """
+    if df is not None:
+        return (df * 100).round(1)
+    return _veracity_pct_raw().copy()
+
+
+def png_requested(argv=None):
+    """Whether PNG export was requested via --png or the EMIT_PNG environment variable."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--png', action='store_true')
+    args, _ = parser.parse_known_args(argv)
+    return args.png or os.environ.get('EMIT_PNG', '').lower() in ('1', 'true', 'yes')
+
+
+def _save_image(fig, path, pending_images=None, emit_png=False):
+    """
+    Write a PNG now, or queue it when the caller batches image export.
+    PNG export launches Kaleido and is skipped unless emit_png is set.
+    """
+    if not emit_png:
+        return
+    if pending_images is None:
+        fig.write_image(path, scale=2)
+    else:
+        pending_images.append((fig, path))
+
+
+def _write(fig, stem, pending_images=None, emit_png=False):
+    """
+    Write <stem>.html (and <stem>.png when requested).
+    Figures are built from validated graph_objects, so the HTML export skips
+    re-validation and references plotly.js from the CDN instead of inlining it.
+    """
+    fig.write_html(f'{stem}.html', validate=False, include_plotlyjs='cdn')
+    _save_image(fig, f'{stem}.png', pending_images, emit_png)
+
+
+def _write_images(pending_images):
+    """
+    Export all queued PNGs in one batch.
+    Kaleido start-up dominates PNG export, so one batch beats one launch per figure.
+    """
+    if not pending_images:
+        return
+    
+    figs, paths = zip(*pending_images)
+    if hasattr(pio, 'write_images'):
+        pio.write_images(list(figs), list(paths), scale=2)
+    else:
+        # Older Plotly: the Kaleido scope stays alive between calls
+        for fig, path in pending_images:
+            pio.write_image(fig, path, scale=2)
+
+
+def create_veracity_performance_heatmap(df=None, pending_images=None, emit_png=False):
     """
     Create heatmap showing AI accuracy across content types.
     Primary visualization showcasing UniteSocial's comprehensive fact-checking.
     """
-    df = pd.read_csv('analytics/output/veracity_performance.csv', index_col=0)
-    
-    # Convert to percentage for display
-    df_pct = (df * 100).round(1)
+    # Percentages for display
+    df_pct = veracity_pct(df)
     
     fig = go.Figure(data=go.Heatmap(
         z=df_pct.values,
@@ -44,34 +127,25 @@ def create_veracity_performance_heatmap():
         font=dict(family='Arial', size=12)
     )
     
-    fig.write_html('analytics/output/veracity_performance.html')
-    fig.write_image('analytics/output/veracity_performance.png', scale=2)
+    _write(fig, 'analytics/output/veracity_performance', pending_images, emit_png)
     print("[OK] Generated: veracity_performance")
 
 
-def create_multi_search_heatmap():
+def create_multi_search_heatmap(df=None, pending_images=None, emit_png=False):
     """
     Create heatmap showing effectiveness of multiple web searches.
     Highlights UniteSocial's technical innovation.
     """
-    df = pd.read_csv('analytics/output/multi_search_effectiveness.csv')
+    if df is None:
+        df = _load_csv('analytics/output/multi_search_effectiveness.csv')
     
     # Create matrix for heatmap
-    data = {
-        'Metric': ['Accuracy', 'Coverage'],
-        '1 search': [df[df['searches']==1]['accuracy'].values[0]*100, 
-                    df[df['searches']==1]['coverage'].values[0]*100],
-        '2 searches': [df[df['searches']==2]['accuracy'].values[0]*100,
-                      df[df['searches']==2]['coverage'].values[0]*100],
-        '3 searches': [df[df['searches']==3]['accuracy'].values[0]*100,
-                     df[df['searches']==3]['coverage'].values[0]*100],
-        '5 searches': [df[df['searches']==5]['accuracy'].values[0]*100,
-                      df[df['searches']==5]['coverage'].values[0]*100],
-        '8 searches': [df[df['searches']==8]['accuracy'].values[0]*100,
-                      df[df['searches']==8]['coverage'].values[0]*100]
-    }
-    
-    heatmap_df = pd.DataFrame(data).set_index('Metric')
+    searches = [1, 2, 3, 5, 8]
+    indexed = df.set_index('searches').loc[searches, ['accuracy', 'coverage']] * 100
+    
+    heatmap_df = indexed.T
+    heatmap_df.index = ['Accuracy', 'Coverage']
+    heatmap_df.columns = [f"{n} search{'es' if n > 1 else ''}" for n in searches]
     
     fig = go.Figure(data=go.Heatmap(
         z=heatmap_df.values,
@@ -98,32 +172,25 @@ def create_multi_search_heatmap():
         font=dict(family='Arial', size=12)
     )
     
-    fig.write_html('analytics/output/multi_search_effectiveness.html')
-    fig.write_image('analytics/output/multi_search_effectiveness.png', scale=2)
+    _write(fig, 'analytics/output/multi_search_effectiveness', pending_images, emit_png)
     print("[OK] Generated: multi_search_effectiveness")
 
 
-def create_response_time_heatmap():
+def create_response_time_heatmap(df=None, pending_images=None, emit_png=False):
     """
     Create heatmap showing response time by complexity.
     Demonstrates real-time capability for Try Unite-I Live.
     """
-    df = pd.read_csv('analytics/output/response_times.csv')
+    if df is None:
+        df = _load_csv('analytics/output/response_times.csv')
     
     # Create time categories
-    time_data = {
-        'Metric': ['Average', '95th Percentile'],
-        '1 claim': [df[df['claims']==1]['avg_response_time'].values[0],
-                    df[df['claims']==1]['p95_response_time'].values[0]],
-        '2 claims': [df[df['claims']==2]['avg_response_time'].values[0],
-                     df[df['claims']==2]['p95_response_time'].values[0]],
-        '3 claims': [df[df['claims']==3]['avg_response_time'].values[0],
-                     df[df['claims']==3]['p95_response_time'].values[0]],
-        '4 claims': [df[df['claims']==4]['avg_response_time'].values[0],
-                     df[df['claims']==4]['p95_response_time'].values[0]]
-    }
-    
-    heatmap_df = pd.DataFrame(time_data).set_index('Metric')
+    claims = [1, 2, 3, 4]
+    indexed = df.set_index('claims').loc[claims, ['avg_response_time', 'p95_response_time']]
+    
+    heatmap_df = indexed.T
+    heatmap_df.index = ['Average', '95th Percentile']
+    heatmap_df.columns = [f"{n} claim{'s' if n > 1 else ''}" for n in claims]
     
     fig = go.Figure(data=go.Heatmap(
         z=heatmap_df.values,
@@ -150,20 +217,25 @@ def create_response_time_heatmap():
         font=dict(family='Arial', size=12)
     )
     
-    fig.write_html('analytics/output/response_times.html')
-    fig.write_image('analytics/output/response_times.png', scale=2)
+    _write(fig, 'analytics/output/response_times', pending_images, emit_png)
     print("[OK] Generated: response_times")
 
 
-def create_timeline_coverage_heatmap():
+def create_timeline_coverage_heatmap(df=None, pending_images=None, emit_png=False):
     """
     Create timeline heatmap showing growing web search coverage.
     Demonstrates expanding knowledge base.
     """
-    df = pd.read_csv('analytics/output/search_coverage_timeline.csv', index_col=0, parse_dates=True)
+    if df is None:
+        df = _load_csv('analytics/output/search_coverage_timeline.csv', index_col=0, parse_dates=True)
     
-    # Calculate improvement percentage
-    df_pct = df.apply(lambda x: ((x - x.min()) / x.max() * 100) + 20, axis=0)
+    # Calculate improvement percentage (column-wise, broadcast over all dates)
+    values = df.to_numpy(dtype=np.float32)
+    df_pct = pd.DataFrame(
+        ((values - values.min(axis=0)) / values.max(axis=0)) * 100 + 20,
+        index=df.index,
+        columns=df.columns
+    )
     
     fig = go.Figure(data=go.Heatmap(
         z=df_pct.values.T,
@@ -188,17 +260,19 @@ def create_timeline_coverage_heatmap():
         xaxis=dict(tickformat='%Y-%m')
     )
     
-    fig.write_html('analytics/output/search_coverage_timeline.html')
-    fig.write_image('analytics/output/search_coverage_timeline.png', scale=2)
+    _write(fig, 'analytics/output/search_coverage_timeline', pending_images, emit_png)
     print("[OK] Generated: search_coverage_timeline")
 
 
-def create_web_search_distribution():
+def create_web_search_distribution(df=None, pending_images=None, emit_png=False):
     """
     Create visualization showing web search source distribution.
     Emphasizes reliance on web search over training data.
     """
-    df = pd.read_csv('analytics/output/web_search_distribution.csv')
+    import plotly.express as px  # only this chart needs plotly.express
+
+    if df is None:
+        df = _load_csv('analytics/output/web_search_distribution.csv')
     
     fig = px.pie(df, 
                  values='percentage', 
@@ -213,28 +287,46 @@ def create_web_search_distribution():
         height=500
     )
     
-    fig.write_html('analytics/output/web_search_distribution.html')
-    fig.write_image('analytics/output/web_search_distribution.png', scale=2)
+    _write(fig, 'analytics/output/web_search_distribution', pending_images, emit_png)
     print("[OK] Generated: web_search_distribution")
 
 
-def generate_all_heatmaps():
-    """Generate all visualizations."""
+_GENERATORS = {
+    'veracity': create_veracity_performance_heatmap,
+    'multi': create_multi_search_heatmap,
+    'response': create_response_time_heatmap,
+    'timeline': create_timeline_coverage_heatmap,
+    'dist': create_web_search_distribution,
+}
+
+
+def generate_all_heatmaps(emit_png=None, data=None):
+    """
+    Generate all visualizations.
+    data maps generator names to in-memory frames (see
+    generate_mock_data.save_all_data); missing entries are read from CSV.
+    """
+    if emit_png is None:
+        emit_png = png_requested()
+    data = data or {}
+    
     print("\nGenerating heatmaps for UniteSocial AI visualization...\n")
     
-    create_veracity_performance_heatmap()
-    create_multi_search_heatmap()
-    create_response_time_heatmap()
-    create_timeline_coverage_heatmap()
-    create_web_search_distribution()
+    # Each visualization uses its handed-over frame (or its own CSV); PNGs go out in one batch
+    pending_images = []
+    for name, generate in _GENERATORS.items():
+        generate(data.get(name), pending_images, emit_png)
+    
+    _write_images(pending_images)
     
+    suffix = 'html/png' if emit_png else 'html'
     print("\n[DONE] All heatmaps generated successfully!")
     print("\nFiles created in analytics/output/:")
-    print("  - veracity_performance.html/png")
-    print("  - multi_search_effectiveness.html/png")
-    print("  - response_times.html/png")
-    print("  - search_coverage_timeline.html/png")
-    print("  - web_search_distribution.html/png")
+    print(f"  - veracity_performance.{suffix}")
+    print(f"  - multi_search_effectiveness.{suffix}")
+    print(f"  - response_times.{suffix}")
+    print(f"  - search_coverage_timeline.{suffix}")
+    print(f"  - web_search_distribution.{suffix}")
 
 
 if __name__ == '__main__':
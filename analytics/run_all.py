@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Run all analytics generation scripts."""
-import subprocess
 import sys
 import os
 
@@ -33,10 +32,10 @@ def main():
         import generate_heatmaps as gh
         
         print("\nGenerating data...")
-        gm.save_all_data()
+        data = gm.save_all_data()
         
         print("\nCreating visualizations...")
-        gh.generate_all_heatmaps()
+        gh.generate_all_heatmaps(emit_png=gh.png_requested(), data=data)
         
         print("\n" + "=" * 60)
         print("[DONE] All visualizations generated!")
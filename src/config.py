@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field
@@ -7,7 +8,8 @@ class Settings(BaseSettings):
 
     model_config = SettingsConfigDict(
         env_file='.env',
-        env_file_encoding='utf-8'
+        env_file_encoding='utf-8',
+        frozen=True
     )
 
     ANTHROPIC_API_KEY: str = Field(
@@ -36,6 +38,11 @@ class Settings(BaseSettings):
         default="",
         description="Brave Search API key for web search"
     )
+    BRAVE_MAX_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum concurrent Brave Search requests; further searches wait for a free slot"
+    )
     ENABLE_WEB_SEARCH: bool = Field(
         default=True,
         description="Enable web search for fact-checking"
@@ -44,6 +51,24 @@ class Settings(BaseSettings):
     ENABLE_ADVANCED_ANALYSIS: bool = True
     ENABLE_VERACITY_CHECK: bool = True
     ENABLE_NUANCE_ANALYSIS: bool = True
+    ENABLE_COMBINED_ANALYSIS: bool = Field(
+        default=False,
+        description="Run classification, political and intent analysis as one combined LLM request"
+    )
+    TRUST_INTERNAL_MODELS: bool = Field(
+        default=False,
+        description="Build response models from already-typed pipeline values without re-validating them"
+    )
+    BATCH_MAX_CONCURRENCY: int = Field(
+        default=4,
+        ge=1,
+        description="Maximum posts from /evaluate_batch analysed at once across all batch requests"
+    )
+    BATCH_POSTS_PER_MINUTE: int = Field(
+        default=50,
+        ge=1,
+        description="Posts a client may submit through /evaluate_batch per minute"
+    )
 
     EN_POST_TYPES: List[str] = [
         "Factual Claim", "Opinion", "Question",
@@ -72,6 +97,15 @@ class Settings(BaseSettings):
         "Provozierend", "Kommerziell", "Unterhaltend"
     ]
 
+    ANALYSIS_CACHE_SIZE: int = Field(
+        default=10000,
+        description="Maximum number of cached post analyses; 0 disables the cache"
+    )
+    ANALYSIS_CACHE_TTL: int = Field(
+        default=3600,
+        description="Seconds a cached post analysis stays valid"
+    )
+
     INTENT_CONFIDENCE_THRESHOLD: float = 0.3
     SPAM_CONFIDENCE_THRESHOLD: float = 0.7
 
@@ -100,4 +134,10 @@ class Settings(BaseSettings):
     )
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing .env and the environment only once."""
+    return Settings()
+
+
+settings = get_settings()
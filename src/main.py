@@ -7,12 +7,16 @@ using LLM-powered analysis with web search verification.
 https://github.com/UniteSocial/Unite-I
 """
 
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request, HTTPException
+from fastapi import FastAPI, Request, Response, HTTPException
+from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
+from limits import parse
+from pydantic import TypeAdapter, ValidationError
 from slowapi import Limiter, _rate_limit_exceeded_handler
 from slowapi.util import get_remote_address
 from slowapi.errors import RateLimitExceeded
@@ -20,10 +24,15 @@ from slowapi.errors import RateLimitExceeded
 from .config import settings
 from .models.api_models import (
     SocialMediaPostRequest,
+    BatchEvaluationRequest,
     AdvancedEvaluationResponse,
-    HealthResponse
+    BatchEvaluationResponse,
+    EVALUATION_RESPONSE_TYPES,
+    HealthResponse,
+    REQUEST_JSON_SCHEMA,
+    BATCH_REQUEST_JSON_SCHEMA
 )
-from .services.evaluation_service import AdvancedEvaluationService
+from .services.evaluation_service import AdvancedEvaluationService, iso_now
 
 # Configure logging
 log_level = os.environ.get('LOG_LEVEL', 'INFO').upper()
@@ -48,16 +57,37 @@ logger = logging.getLogger(__name__)
 
 VERSION = "2.0.0"
 
+CORS_ORIGINS = (
+    ["*"] if settings.CORS_ALLOWED_ORIGINS == "*"
+    else [origin.strip() for origin in settings.CORS_ALLOWED_ORIGINS.split(",")]
+)
+
 app_state = {}
 
 limiter = Limiter(key_func=get_remote_address)
 
+# Request bodies are parsed straight from bytes by pydantic-core
+_REQUEST_TA = TypeAdapter(SocialMediaPostRequest)
+_BATCH_REQUEST_TA = TypeAdapter(BatchEvaluationRequest)
+
+_REQUEST_BODY_OPENAPI = {
+    "required": True,
+    "content": {"application/json": {"schema": REQUEST_JSON_SCHEMA}},
+}
+
+_BATCH_REQUEST_BODY_OPENAPI = {
+    "required": True,
+    "content": {"application/json": {"schema": BATCH_REQUEST_JSON_SCHEMA}},
+}
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     app_state["evaluation_service"] = AdvancedEvaluationService()
+    app_state["batch_semaphore"] = asyncio.Semaphore(settings.BATCH_MAX_CONCURRENCY)
     logger.info("Unite-I service started")
     yield
+    await app_state["evaluation_service"].aclose()
     app_state.clear()
     logger.info("Unite-I service stopped")
 
@@ -77,15 +107,12 @@ def create_app() -> FastAPI:
     app.state.limiter = limiter
     app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
     
-    cors_origins = settings.CORS_ALLOWED_ORIGINS.split(",") if settings.CORS_ALLOWED_ORIGINS != "*" else ["*"]
-    cors_origins = [origin.strip() for origin in cors_origins]
-    
-    if cors_origins == ["*"]:
+    if CORS_ORIGINS == ["*"]:
         logger.warning("CORS allows all origins. Restrict in production!")
     
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=cors_origins,
+        allow_origins=CORS_ORIGINS,
         allow_credentials=False,
         allow_methods=["GET", "POST", "OPTIONS"],
         allow_headers=["Content-Type", "Authorization"],
@@ -100,8 +127,22 @@ app = create_app()
 @app.get("/", response_model=HealthResponse, tags=["Health"])
 @limiter.limit("30/minute")
 async def root(request: Request) -> HealthResponse:
+    """Cheap liveness check for load balancers; does not call any LLM."""
+    status = "operational" if "evaluation_service" in app_state else "starting"
+
+    return HealthResponse(
+        status=status,
+        timestamp=iso_now(),
+        version=VERSION
+    )
+
+
+@app.get("/healthz/deep", response_model=HealthResponse, tags=["Health"])
+@limiter.limit("5/minute")
+async def deep_health(request: Request) -> HealthResponse:
+    """Run the full analysis pipeline once to verify LLM and search connectivity."""
     service = get_evaluation_service()
-    test_result = await service.perform_full_analysis("health", "test", "en")
+    test_result = await service.perform_full_analysis("health", "test", "en", use_cache=False)
 
     return HealthResponse(
         status="operational",
@@ -110,9 +151,25 @@ async def root(request: Request) -> HealthResponse:
     )
 
 
-@app.post("/evaluate", response_model=AdvancedEvaluationResponse, tags=["Analysis"])
+def _validate_body(adapter: TypeAdapter, raw: bytes):
+    try:
+        return adapter.validate_json(raw)
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**error, "loc": ("body", *error["loc"])} for error in e.errors(include_url=False)]
+        )
+
+
+@app.post(
+    "/evaluate",
+    response_model=AdvancedEvaluationResponse,
+    tags=["Analysis"],
+    openapi_extra={"requestBody": _REQUEST_BODY_OPENAPI},
+)
 @limiter.limit("10/minute")
-async def evaluate_content(request: Request, body: SocialMediaPostRequest) -> AdvancedEvaluationResponse:
+async def evaluate_content(request: Request) -> Response:
+    body = _validate_body(_REQUEST_TA, await request.body())
+
     try:
         service = get_evaluation_service()
         result = await service.perform_full_analysis(
@@ -120,7 +177,10 @@ async def evaluate_content(request: Request, body: SocialMediaPostRequest) -> Ad
             post_text=body.post_text,
             language=body.language
         )
-        return AdvancedEvaluationResponse(**result)
+        # Fields are already model instances from the evaluation service
+        response = EVALUATION_RESPONSE_TYPES[result["kind"]].model_construct(**result)
+        # Serialize in pydantic-core; response_model still documents the schema
+        return Response(content=response.model_dump_json(), media_type="application/json")
     except Exception as e:
         logger.error(f"Error processing evaluation request: {type(e).__name__}: {e}", exc_info=True)
         raise HTTPException(
@@ -129,6 +189,55 @@ async def evaluate_content(request: Request, body: SocialMediaPostRequest) -> Ad
         )
 
 
+def _charge_batch_posts(request: Request, posts: int) -> None:
+    # Each post costs as much as an /evaluate call, so the budget counts posts rather than requests
+    if not limiter.enabled:
+        return
+    limit = parse(f"{settings.BATCH_POSTS_PER_MINUTE}/minute")
+    if not limiter.limiter.hit(limit, "evaluate_batch_posts", get_remote_address(request), cost=posts):
+        raise HTTPException(
+            status_code=429,
+            detail=f"Rate limit exceeded: {limit}"
+        )
+
+
+@app.post(
+    "/evaluate_batch",
+    response_model=BatchEvaluationResponse,
+    tags=["Analysis"],
+    openapi_extra={"requestBody": _BATCH_REQUEST_BODY_OPENAPI},
+)
+async def evaluate_batch(request: Request) -> Response:
+    """Evaluate several posts in one round trip; results keep the request order."""
+    body = _validate_body(_BATCH_REQUEST_TA, await request.body())
+    _charge_batch_posts(request, len(body.posts))
+
+    try:
+        service = get_evaluation_service()
+        semaphore = app_state["batch_semaphore"]
+
+        async def analyse(post):
+            async with semaphore:
+                return await service.perform_full_analysis(
+                    post_id=post.post_id,
+                    post_text=post.post_text,
+                    language=post.language
+                )
+
+        results = await asyncio.gather(*(analyse(post) for post in body.posts))
+        response = BatchEvaluationResponse.model_construct(results=[
+            EVALUATION_RESPONSE_TYPES[result["kind"]].model_construct(**result)
+            for result in results
+        ])
+        return Response(content=response.model_dump_json(), media_type="application/json")
+    except Exception as e:
+        logger.error(f"Error processing batch evaluation request: {type(e).__name__}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=500,
+            detail="Analysis failed. Please try again later."
+        )
+
+
 @app.get("/config", tags=["Configuration"])
 @limiter.limit("30/minute")
 def get_config(request: Request) -> dict:
@@ -1,6 +1,7 @@
-from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field, field_validator
+from dataclasses import dataclass
+from enum import Enum, IntFlag
+from typing import Annotated, List, Literal, Optional, Union
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, field_serializer
 
 
 class Language(str, Enum):
@@ -9,6 +10,12 @@ class Language(str, Enum):
     GERMAN = "de"
 
 
+LANGUAGE_LOOKUP = {m.value: m for m in Language}
+
+# Wire value of Language, for response fields that are never compared in Python
+LanguageCode = Literal["en", "de"]
+
+
 class PostType(str, Enum):
 
     FACTUAL_CLAIM = "Factual Claim"
@@ -18,6 +25,11 @@ class PostType(str, Enum):
     PROMOTION = "Promotion"
 
 
+POST_TYPE_LOOKUP = {m.value: m for m in PostType}
+
+PostTypeLabel = Literal["Factual Claim", "Opinion", "Question", "Personal Update", "Promotion"]
+
+
 class VeracityStatus(str, Enum):
 
     FACTUALLY_CORRECT = "Factually Correct"
@@ -26,6 +38,9 @@ class VeracityStatus(str, Enum):
     UNVERIFIABLE = "Unverifiable"
 
 
+VERACITY_STATUS_LOOKUP = {m.value: m for m in VeracityStatus}
+
+
 class PoliticalTendency(str, Enum):
 
     LEFT = "Links"
@@ -36,52 +51,84 @@ class PoliticalTendency(str, Enum):
     NEUTRAL = "Neutral"
 
 
-class Intent(str, Enum):
+POLITICAL_TENDENCY_LOOKUP = {m.value: m for m in PoliticalTendency}
+
+
+class Intent(IntFlag):
+    """Detected intents as a bitmask; serialized as a list of labels."""
 
-    INFORMATIVE = "Informative"
-    PERSUASIVE = "Persuasive"
-    SATIRICAL = "Satirical"
-    PROVOCATIVE = "Provocative"
-    COMMERCIAL = "Commercial"
-    ENTERTAINING = "Entertaining"
+    INFORMATIVE = 1
+    PERSUASIVE = 2
+    SATIRICAL = 4
+    PROVOCATIVE = 8
+    COMMERCIAL = 16
+    ENTERTAINING = 32
+
+
+IntentLabel = Literal[
+    "Informative", "Persuasive", "Satirical", "Provocative", "Commercial", "Entertaining"
+]
+
+INTENT_LABELS = {
+    Intent.INFORMATIVE: "Informative",
+    Intent.PERSUASIVE: "Persuasive",
+    Intent.SATIRICAL: "Satirical",
+    Intent.PROVOCATIVE: "Provocative",
+    Intent.COMMERCIAL: "Commercial",
+    Intent.ENTERTAINING: "Entertaining",
+}
+
+INTENT_LOOKUP = {label: intent for intent, label in INTENT_LABELS.items()}
+
+
+PostText = Annotated[str, StringConstraints(min_length=10, max_length=10000)]
+
+
+# Response models are built server-side from trusted data and never mutated
+RESPONSE_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, ser_json_bytes="utf8")
 
 
 class SocialMediaPostRequest(BaseModel):
 
+    model_config = ConfigDict(use_enum_values=True)
+
     post_id: str = Field(
         ...,
         description="Unique identifier for the post"
     )
-    post_text: str = Field(
+    post_text: PostText = Field(
         ...,
-        min_length=10,
-        max_length=10000,
         description="The text content of the post to evaluate (10-10000 characters)"
     )
-    language: Optional[str] = Field(
-        "en",
+    language: Language = Field(
+        Language.ENGLISH.value,
         description="Language of the post (en/de)"
     )
 
-    @field_validator('language')
-    @classmethod
-    def validate_language(cls, v):
-        """Validate that language is one of the supported values."""
-        if v not in ["en", "de"]:
-            raise ValueError('Language must be either "en" or "de"')
-        return v
-
 
 class Source(BaseModel):
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     title: str = Field(..., description="Title of the source")
     url: str = Field(..., description="URL of the source")
     snippet: str = Field(..., description="Text snippet from the source")
 
 
+@dataclass(slots=True, frozen=True)
+class SourceRow:
+    """Lightweight internal source record; converted to Source when building responses."""
+
+    title: str
+    url: str
+    snippet: str
+
+
 class PostAnalysis(BaseModel):
 
-    post_type: PostType = Field(
+    model_config = RESPONSE_MODEL_CONFIG
+
+    post_type: PostTypeLabel = Field(
         ...,
         description="Classification of the post type"
     )
@@ -93,6 +140,8 @@ class PostAnalysis(BaseModel):
 
 class VeracityAnalysis(BaseModel):
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     status: VeracityStatus = Field(
         ...,
         description="Veracity status of the claim"
@@ -111,13 +160,38 @@ class VeracityAnalysis(BaseModel):
     )
 
 
+class PoliticalScores(BaseModel):
+
+    model_config = RESPONSE_MODEL_CONFIG | ConfigDict(extra="forbid")
+
+    links: float = Field(..., description="Confidence score for Links")
+    mitte_links: float = Field(..., description="Confidence score for Mitte-Links")
+    mitte: float = Field(..., description="Confidence score for Mitte")
+    mitte_rechts: float = Field(..., description="Confidence score for Mitte-Rechts")
+    rechts: float = Field(..., description="Confidence score for Rechts")
+    neutral: float = Field(..., description="Confidence score for Neutral")
+
+
+# PoliticalScores field holding the score of each tendency
+POLITICAL_SCORE_FIELDS = {
+    PoliticalTendency.LEFT: "links",
+    PoliticalTendency.CENTER_LEFT: "mitte_links",
+    PoliticalTendency.CENTER: "mitte",
+    PoliticalTendency.CENTER_RIGHT: "mitte_rechts",
+    PoliticalTendency.RIGHT: "rechts",
+    PoliticalTendency.NEUTRAL: "neutral",
+}
+
+
 class PoliticalTendencyAnalysis(BaseModel):
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     primary: PoliticalTendency = Field(
         ...,
         description="Primary political tendency"
     )
-    scores: dict[str, float] = Field(
+    scores: PoliticalScores = Field(
         ...,
         description="Confidence scores for all tendencies"
     )
@@ -125,44 +199,145 @@ class PoliticalTendencyAnalysis(BaseModel):
 
 class NuanceAnalysis(BaseModel):
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     political_tendency: PoliticalTendencyAnalysis = Field(
         ...,
         description="Political tendency analysis"
     )
-    detected_intents: List[Intent] = Field(
-        ...,
+    detected_intents: Intent = Field(
+        Intent(0),
         description="Detected intents in the post"
     )
 
+    @field_serializer("detected_intents")
+    def _serialize_intents(self, intents: Intent) -> List[IntentLabel]:
+        return [label for intent, label in INTENT_LABELS.items() if intent & intents]
+
 
-class AdvancedEvaluationResponse(BaseModel):
+class _EvaluationResponseBase(BaseModel):
 
+    model_config = RESPONSE_MODEL_CONFIG
+
+    kind: str = Field(..., description="Response variant: spam, claim, nonclaim or error")
     post_id: str = Field(..., description="Original post ID")
     analysis_timestamp: str = Field(
         ...,
         description="ISO timestamp of analysis"
     )
-    language: str = Field(..., description="Language of the post")
+    language: LanguageCode = Field(..., description="Language of the post")
     post_analysis: PostAnalysis = Field(
         ...,
         description="Post type and spam analysis"
     )
-    veracity_analysis: Optional[VeracityAnalysis] = Field(
-        None,
-        description="Veracity analysis (only for claims)"
+
+
+class SpamResponse(_EvaluationResponseBase):
+
+    kind: Literal["spam"] = "spam"
+    veracity_analysis: None = Field(None, description="Always null for spam")
+    nuance_analysis: None = Field(None, description="Always null for spam")
+    processing_error: None = Field(None, description="Always null on success")
+
+
+class ClaimResponse(_EvaluationResponseBase):
+
+    kind: Literal["claim"] = "claim"
+    veracity_analysis: VeracityAnalysis = Field(
+        ...,
+        description="Veracity analysis of the factual claim"
     )
     nuance_analysis: Optional[NuanceAnalysis] = Field(
         None,
-        description="Nuance analysis results (null for spam content)"
+        description="Nuance analysis results (null if disabled)"
     )
-    processing_error: Optional[str] = Field(
+    processing_error: None = Field(None, description="Always null on success")
+
+
+class NonClaimResponse(_EvaluationResponseBase):
+
+    kind: Literal["nonclaim"] = "nonclaim"
+    veracity_analysis: None = Field(None, description="Always null for non-claims")
+    nuance_analysis: Optional[NuanceAnalysis] = Field(
         None,
-        description="Error message if processing failed"
+        description="Nuance analysis results (null if disabled)"
+    )
+    processing_error: None = Field(None, description="Always null on success")
+
+
+class ErrorResponse(_EvaluationResponseBase):
+
+    kind: Literal["error"] = "error"
+    veracity_analysis: None = Field(None, description="Always null on failure")
+    nuance_analysis: None = Field(None, description="Always null on failure")
+    processing_error: str = Field(..., description="Error message describing the failure")
+
+
+# Tagged by "kind" so pydantic-core resolves one concrete schema per response
+AdvancedEvaluationResponse = Annotated[
+    Union[SpamResponse, ClaimResponse, NonClaimResponse, ErrorResponse],
+    Field(discriminator="kind")
+]
+
+EVALUATION_RESPONSE_TYPES = {
+    "spam": SpamResponse,
+    "claim": ClaimResponse,
+    "nonclaim": NonClaimResponse,
+    "error": ErrorResponse,
+}
+
+
+MAX_BATCH_POSTS = 25
+
+
+class BatchEvaluationRequest(BaseModel):
+
+    posts: List[SocialMediaPostRequest] = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_BATCH_POSTS,
+        description=f"Posts to evaluate in one request (1-{MAX_BATCH_POSTS})"
+    )
+
+
+class BatchEvaluationResponse(BaseModel):
+
+    model_config = RESPONSE_MODEL_CONFIG
+
+    results: List[AdvancedEvaluationResponse] = Field(
+        ...,
+        description="One analysis per submitted post, in request order"
     )
 
 
 class HealthResponse(BaseModel):
 
+    model_config = RESPONSE_MODEL_CONFIG
+
     status: str = Field(..., description="Service status")
     timestamp: str = Field(..., description="Current timestamp")
     version: str = Field(..., description="Service version")
+
+
+def _inline_defs(schema: dict) -> dict:
+    """Resolve local $defs references so the schema can be embedded in OpenAPI."""
+    defs = schema.get("$defs", {})
+
+    def resolve(node):
+        if isinstance(node, dict):
+            ref = node.get("$ref", "")
+            if ref.startswith("#/$defs/"):
+                # Sibling keys (default, description) override the shared definition
+                siblings = {key: resolve(value) for key, value in node.items() if key != "$ref"}
+                return {**resolve(defs[ref.rsplit("/", 1)[-1]]), **siblings}
+            return {key: resolve(value) for key, value in node.items()}
+        if isinstance(node, list):
+            return [resolve(item) for item in node]
+        return node
+
+    return resolve({key: value for key, value in schema.items() if key != "$defs"})
+
+
+# Request body schema, generated once at import for the OpenAPI document
+REQUEST_JSON_SCHEMA = _inline_defs(SocialMediaPostRequest.model_json_schema(mode="validation"))
+BATCH_REQUEST_JSON_SCHEMA = _inline_defs(BatchEvaluationRequest.model_json_schema(mode="validation"))
@@ -2,21 +2,43 @@
 Unite-I LLM services.
 
 Provides content analysis capabilities using various LLM providers.
+Submodules are imported on first attribute access, so importing one
+service does not pull in every provider SDK.
 """
 
-from .base_llm_service import BaseLLMService
-from .claude_service import ClaudeService
-from .mistral_service import MistralService
-from .search_service import SearchService
-from .evaluation_service import AdvancedEvaluationService
-from .prompt_loader import load_prompt, get_available_prompts
+import importlib
+
+_LAZY = {
+    "BaseLLMService": ".base_llm_service",
+    "ClaudeService": ".claude_service",
+    "MistralService": ".mistral_service",
+    "SearchService": ".search_service",
+    "SearchRateLimitError": ".search_service",
+    "AdvancedEvaluationService": ".evaluation_service",
+    "load_prompt": ".prompt_loader",
+    "get_available_prompts": ".prompt_loader",
+}
 
 __all__ = [
     "BaseLLMService",
     "ClaudeService",
     "MistralService",
     "SearchService",
+    "SearchRateLimitError",
     "AdvancedEvaluationService",
     "load_prompt",
     "get_available_prompts",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(_LAZY[name], __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -9,16 +9,25 @@ import json
 import logging
 import re
 import asyncio
+import hashlib
+import traceback
 from abc import ABC, abstractmethod
 from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from datetime import date
+from functools import lru_cache
+
+from cachetools import TTLCache
+from json_repair import repair_json
 
 from ..config import settings
+from ..models.api_models import VERACITY_STATUS_LOOKUP, SourceRow
+from .fallbacks import fallback_scope, note_fallback
 from .search_service import SearchService
 from .prompt_loader import (
     get_classification_prompt,
     get_political_analysis_prompt,
     get_intent_analysis_prompt,
+    get_combined_analysis_prompt,
     get_veracity_prompt
 )
 
@@ -33,6 +42,142 @@ MIN_URL_LENGTH = 5
 MIN_WORD_LENGTH_FOR_MATCHING = 3
 MIN_RELEVANCE_SCORE = 2
 AUTO_MAP_FALLBACK_SOURCES = 2
+SEARCH_CONCURRENCY = 4
+MAX_CLAIM_QUERY_WORDS = 15
+VERACITY_CACHE_SIZE = 1024
+VERACITY_CACHE_TTL = 900  # seconds
+
+# Response cleanup patterns
+_FENCE_OPEN_RE = re.compile(r'^```[a-z]*\s*', re.MULTILINE)
+_FENCE_CLOSE_RE = re.compile(r'\s*```\s*$', re.MULTILINE)
+_JSON_OBJ_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Search query extraction patterns
+_PROPER_NOUN_RE = re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b')
+_YEAR_RE = re.compile(r'\b(2024|2025|2026)\b')
+_TOKEN_RE = re.compile(r'\w+')
+
+# Typographic quotes in search snippets, normalized to plain double quotes
+_SANITIZE_TABLE = str.maketrans({
+    '\u00BB': '"', '\u00AB': '"',
+    '\u201C': '"', '\u201D': '"', '\u201E': '"',
+})
+
+# Claim keywords (matched as lowercase substrings) and the trigger group they select
+QUERY_TRIGGERS = {
+    "de": {
+        "bundeskanzler": "chancellor", "kanzler": "chancellor",
+        "buch": "book", "autobiografie": "book", "biografie": "book",
+        "merz": "merz",
+    },
+    "en": {
+        "chancellor": "chancellor",
+        "book": "book", "autobiography": "book", "biography": "book",
+        "merz": "merz",
+    },
+}
+
+# Extra queries per detected proper noun, in emission order
+NAME_QUERY_TEMPLATES = {
+    "de": (
+        ("chancellor", ("{name} Bundeskanzler Deutschland", "Bundeskanzler Deutschland aktuell")),
+        ("book", ("{name} Buch Autobiografie", "{name} Buch 2024 2025")),
+    ),
+    "en": (
+        ("chancellor", ("{name} Chancellor Germany", "Germany Chancellor current")),
+        ("book", ("{name} book autobiography",)),
+    ),
+}
+
+# Extra queries added once per claim
+CLAIM_QUERY_TEMPLATES = {
+    "de": (("merz", ("Friedrich Merz Bundeskanzler", "Deutschland Bundeskanzler 2025")),),
+    "en": (("merz", ("Friedrich Merz Chancellor", "Germany Chancellor 2025")),),
+}
+
+# One alternation per language, longest keyword first; a single finditer pass finds all groups
+_TRIGGER_RES = {
+    language: re.compile("|".join(map(re.escape, sorted(triggers, key=len, reverse=True))))
+    for language, triggers in QUERY_TRIGGERS.items()
+}
+
+
+def _tokenize(text: str) -> frozenset:
+    """Lower-cased word tokens used for relevance matching."""
+    return frozenset(_TOKEN_RE.findall(text.lower()))
+
+
+def _result_tokens(
+    result: Dict,
+    token_map: Optional[Dict[str, Tuple[frozenset, frozenset]]] = None
+) -> Tuple[frozenset, frozenset]:
+    """(snippet, title) tokens, taken from token_map (keyed by URL) when precomputed."""
+    if token_map is not None:
+        tokens = token_map.get(result.get('url', ''))
+        if tokens is not None:
+            return tokens
+    return _tokenize(result.get('snippet', '')), _tokenize(result.get('title', ''))
+
+
+def _source_row(item: Dict, snippet_limit: Optional[int] = None) -> SourceRow:
+    """SourceRow from a parsed LLM or search dict; missing or non-string fields become strings."""
+    snippet = str(item.get("snippet") or "")
+    return SourceRow(
+        title=str(item.get("title") or ""),
+        url=str(item.get("url") or ""),
+        snippet=snippet[:snippet_limit] if snippet_limit is not None else snippet
+    )
+
+
+@lru_cache(maxsize=8)
+def _joined_labels(kind: str, language: str) -> str:
+    """Comma-separated label list for prompts, e.g. kind="POST_TYPES" reads EN_/DE_POST_TYPES."""
+    prefix = "DE" if language == "de" else "EN"
+    return ', '.join(getattr(settings, f"{prefix}_{kind}"))
+
+
+@lru_cache(maxsize=4)
+def _formatted_date(language: str, day: date) -> str:
+    """Prompt date string; keyed by the day so it is formatted once per day and language."""
+    return day.strftime("%d. %B %Y" if language == "de" else "%B %d, %Y")
+
+
+class JsonObjectTracker:
+    """
+    Incremental brace matcher for streamed responses.
+
+    Feed text chunks as they arrive; feed() returns True once the first
+    top-level JSON object has closed, so callers can stop reading.
+    Braces inside string literals are ignored.
+    """
+
+    __slots__ = ("depth", "in_string", "escape", "started")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.started = False
+
+    def feed(self, chunk: str) -> bool:
+        for char in chunk:
+            if self.escape:
+                self.escape = False
+            elif self.in_string:
+                if char == '\\':
+                    self.escape = True
+                elif char == '"':
+                    self.in_string = False
+            elif char == '"':
+                self.in_string = self.started
+            elif char == '{':
+                self.depth += 1
+                self.started = True
+            elif char == '}' and self.started:
+                self.depth -= 1
+                if self.depth == 0:
+                    return True
+        return False
 
 
 class BaseLLMService(ABC):
@@ -42,7 +187,8 @@ class BaseLLMService(ABC):
         self.enabled = False
         self.search_service = SearchService()
         self.web_search_enabled = settings.ENABLE_WEB_SEARCH and self.search_service.enabled
-        self._current_search_results: List[Dict] = []
+        # Completed fact-checks keyed by (language, digest of the normalized claim)
+        self._veracity_cache: TTLCache = TTLCache(maxsize=VERACITY_CACHE_SIZE, ttl=VERACITY_CACHE_TTL)
     
     @property
     @abstractmethod
@@ -51,10 +197,14 @@ class BaseLLMService(ABC):
         pass
     
     @abstractmethod
-    def _make_api_call(self, prompt: str, max_retries: int = 3, is_veracity: bool = False) -> str:
-        """Make an API call to the LLM provider."""
+    async def _make_api_call(self, system: str, prompt: str, max_retries: int = 3, is_veracity: bool = False) -> str:
+        """Make an API call to the LLM provider with static system and per-request user prompts."""
         pass
     
+    async def aclose(self) -> None:
+        """Release provider client resources; called on application shutdown."""
+        await self.search_service.aclose()
+    
     def _log_init_status(self) -> None:
         """Log service initialization status."""
         logger.info(f"[INIT] {self.service_name}Service initialized:")
@@ -79,8 +229,8 @@ class BaseLLMService(ABC):
         labels = self._get_post_type_labels(language)
 
         try:
-            prompt = get_classification_prompt(text, ', '.join(labels), language)
-            response = self._make_api_call(prompt)
+            system, prompt = get_classification_prompt(text, _joined_labels("POST_TYPES", language), language)
+            response = await self._make_api_call(system, prompt)
             return self._parse_classification_response(response, labels)
         except Exception as e:
             logger.error(f"Error in {self.service_name} classification: {e}")
@@ -98,8 +248,8 @@ class BaseLLMService(ABC):
         labels = self._get_political_labels(language)
 
         try:
-            prompt = get_political_analysis_prompt(text, ', '.join(labels), language)
-            response = self._make_api_call(prompt)
+            system, prompt = get_political_analysis_prompt(text, _joined_labels("POLITICAL_LABELS", language), language)
+            response = await self._make_api_call(system, prompt)
             return self._parse_political_response(response, labels)
         except Exception as e:
             logger.error(f"Error in {self.service_name} political analysis: {e}")
@@ -117,50 +267,105 @@ class BaseLLMService(ABC):
         labels = self._get_intent_labels(language)
 
         try:
-            prompt = get_intent_analysis_prompt(text, ', '.join(labels), language)
-            response = self._make_api_call(prompt)
+            system, prompt = get_intent_analysis_prompt(text, _joined_labels("INTENT_LABELS", language), language)
+            response = await self._make_api_call(system, prompt)
             return self._parse_intent_response(response, labels)
         except Exception as e:
             logger.error(f"Error in {self.service_name} intent analysis: {e}")
             return self._get_default_intent_analysis(language)
 
+    async def analyze_all(
+        self,
+        text: str,
+        language: str = "en"
+    ) -> Tuple[Tuple[str, float, Dict[str, float]], Dict[str, float], Dict[str, float]]:
+        """Run classification, political and intent analysis concurrently."""
+        classification, political, intents = await asyncio.gather(
+            self.classify_post_type(text, language),
+            self.analyze_political_tendency(text, language),
+            self.analyze_intents(text, language)
+        )
+        return classification, political, intents
+
+    async def analyze_combined(
+        self,
+        text: str,
+        language: str = "en"
+    ) -> Tuple[Tuple[str, float, Dict[str, float]], Dict[str, float], Dict[str, float]]:
+        """Classification, political and intent analysis from a single model call; same shape as analyze_all."""
+        if not self.enabled:
+            logger.warning(f"{self.service_name} service not enabled, using default combined analysis")
+            return (
+                self._get_default_classification(language),
+                self._get_default_political_analysis(language),
+                self._get_default_intent_analysis(language)
+            )
+
+        try:
+            system, prompt = get_combined_analysis_prompt(
+                text,
+                _joined_labels("POST_TYPES", language),
+                _joined_labels("POLITICAL_LABELS", language),
+                _joined_labels("INTENT_LABELS", language),
+                language
+            )
+            response = await self._make_api_call(system, prompt)
+            return self._parse_combined_response(response, language)
+        except Exception as e:
+            logger.error(f"Error in {self.service_name} combined analysis: {e}")
+            return (
+                self._get_default_classification(language),
+                self._get_default_political_analysis(language),
+                self._get_default_intent_analysis(language)
+            )
+
     async def analyze_veracity(
         self,
         claim: str,
         language: str = "en"
-    ) -> Tuple[str, str, str, List[Dict]]:
-        logger.info(f"[VERACITY] analyze_veracity called - enabled={self.enabled}, web_search_enabled={self.web_search_enabled}")
+    ) -> Tuple[str, str, str, List[SourceRow]]:
+        logger.info("[VERACITY] analyze_veracity called - enabled=%s, web_search_enabled=%s", self.enabled, self.web_search_enabled)
         
         if not self.enabled:
-            logger.warning(f"[VERACITY] {self.service_name} service not enabled, using default veracity analysis")
+            logger.warning("[VERACITY] %s service not enabled, using default veracity analysis", self.service_name)
             status, justification, method = self._get_default_veracity_analysis(claim, language)
             return status, justification, method, []
 
+        cache_key = (language, hashlib.blake2b(claim.strip().lower().encode(), digest_size=16).digest())
+        cached = self._veracity_cache.get(cache_key)
+        if cached is not None:
+            logger.info("[VERACITY] Cache hit for claim: %.100s", claim)
+            status, justification, verification_method, sources = cached
+            return status, justification, verification_method, list(sources)
+
         try:
-            all_search_results = await self._perform_web_searches(claim, language)
-            search_context = self._build_search_context(all_search_results, language)
-            
-            current_date = datetime.now().strftime("%d. %B %Y" if language == "de" else "%B %d, %Y")
-            prompt = get_veracity_prompt(claim, current_date, search_context, language)
-            
-            logger.debug(f"[VERACITY] Prompt length: {len(prompt)} characters")
-            
-            logger.info(f"[VERACITY] Sending request to {self.service_name}...")
-            response = self._make_api_call(prompt, is_veracity=True)
-            logger.info(f"[VERACITY] Received response ({len(response)} characters)")
-            
-            result = self._parse_veracity_response(response)
+            with fallback_scope() as fallbacks:
+                all_search_results = await self._perform_web_searches(claim, language)
+                search_context = self._build_search_context(all_search_results, language)
+                
+                current_date = _formatted_date(language, date.today())
+                system, prompt = get_veracity_prompt(claim, current_date, search_context, language)
+                
+                logger.debug("[VERACITY] Prompt length: %d characters", len(system) + len(prompt))
+                
+                logger.info("[VERACITY] Sending request to %s...", self.service_name)
+                response = await self._make_api_call(system, prompt, is_veracity=True)
+                logger.info("[VERACITY] Received response (%d characters)", len(response))
+                
+                result = self._parse_veracity_response(response, all_search_results)
             status, justification, verification_method, sources = result
             
-            logger.info(f"[VERACITY] Final result: status={status}, sources={len(sources)}")
+            logger.info("[VERACITY] Final result: status=%s, sources=%d", status, len(sources))
             
-            self._current_search_results = []
+            # Failed searches or an unparseable response would otherwise pin a weak verdict
+            if not fallbacks:
+                self._veracity_cache[cache_key] = (status, justification, verification_method, tuple(sources))
             return result
 
         except Exception as e:
-            import traceback
-            logger.error(f"[VERACITY] ERROR: {type(e).__name__}: {e}")
-            logger.error(f"[VERACITY] Traceback:\n{traceback.format_exc()}")
+            logger.error("[VERACITY] ERROR: %s: %s", type(e).__name__, e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[VERACITY] Traceback:\n%s", traceback.format_exc())
             status, justification, method = self._get_default_veracity_analysis(claim, language)
             return status, justification, method, []
 
@@ -172,39 +377,57 @@ class BaseLLMService(ABC):
             logger.error("Web search is DISABLED - veracity analysis will be unreliable!")
             return []
         
-        logger.info(f"[VERACITY] Starting analysis for claim: {claim[:100]}")
+        logger.info("[VERACITY] Starting analysis for claim: %.100s", claim)
         
         search_queries = self._extract_all_search_queries(claim, language)
-        search_queries.insert(0, claim)
-        logger.info(f"[VERACITY] Total queries: {len(search_queries)}")
-        
-        for i, query in enumerate(search_queries[:MAX_SEARCH_QUERIES], 1):
-            logger.info(f"[VERACITY] Search {i}/{min(len(search_queries), MAX_SEARCH_QUERIES)}: {query[:80]}")
-            
-            if i > 1:
-                await asyncio.sleep(0.25)
-            
-            results = await self.search_service.search(
-                query=query,
-                count=RESULTS_PER_QUERY,
-                language=language
-            )
+        logger.info("[VERACITY] Total queries: %d", len(search_queries))
+        
+        queries = search_queries[:MAX_SEARCH_QUERIES]
+        semaphore = asyncio.Semaphore(SEARCH_CONCURRENCY)
+        
+        async def run_query(i: int, query: str) -> List[Dict]:
+            async with semaphore:
+                logger.info("[VERACITY] Search %d/%d: %.80s", i, len(queries), query)
+                results = await self.search_service.search(
+                    query=query,
+                    count=RESULTS_PER_QUERY,
+                    language=language
+                )
             if results:
+                logger.info("[VERACITY] Query %d returned %d results", i, len(results))
+            return results
+        
+        # Overlap the search round-trips; gather keeps results in query order
+        query_results = await asyncio.gather(
+            *(run_query(i, query) for i, query in enumerate(queries, 1)),
+            return_exceptions=True
+        )
+        for i, results in enumerate(query_results, 1):
+            if isinstance(results, BaseException):
+                logger.error("[VERACITY] Query %d failed: %s: %s", i, type(results).__name__, results)
+                note_fallback("search")
+            elif results:
                 all_search_results.extend(results)
-                logger.info(f"[VERACITY] Query {i} returned {len(results)} results")
         
-        # Deduplicate by URL
-        seen_urls = set()
-        unique_results = []
+        # Deduplicate by URL, keeping the first occurrence (earlier queries rank higher)
+        by_url = {}
         for result in all_search_results:
-            if result.get('url') not in seen_urls:
-                seen_urls.add(result.get('url'))
-                unique_results.append(result)
+            if result.get('url'):
+                by_url.setdefault(result['url'], result)
+        unique_results = list(by_url.values())
         
-        logger.info(f"[VERACITY] After deduplication: {len(unique_results)} unique results")
+        # Tokenize once per result for ranking, kept beside the results rather than inside them
+        token_map = {
+            url: (_tokenize(result.get('snippet', '')), _tokenize(result.get('title', '')))
+            for url, result in by_url.items()
+        }
         
-        filtered = self._filter_search_results(unique_results, claim, max_results=MAX_FILTERED_RESULTS)
-        logger.info(f"[VERACITY] Filtered to {len(filtered)} high-quality results")
+        logger.info("[VERACITY] After deduplication: %d unique results", len(unique_results))
+        
+        filtered = self._filter_search_results(
+            unique_results, claim, max_results=MAX_FILTERED_RESULTS, token_map=token_map
+        )
+        logger.info("[VERACITY] Filtered to %d high-quality results", len(filtered))
         
         return filtered
 
@@ -223,14 +446,11 @@ class BaseLLMService(ABC):
                 )
             search_context = "\n\n=== WEB SEARCH RESULTS ===\n" + "\n\n".join(formatted_results)
             
-            self._current_search_results = search_results
-            
             if language == "de":
                 search_context += "\n\n[OK] Die obigen Web-Suchergebnisse sind deine EINZIGE Informationsquelle."
             else:
                 search_context += "\n\n[OK] The above web search results are your ONLY source of information."
         else:
-            self._current_search_results = []
             if language == "de":
                 search_context = "\n\n[NONE] KEINE WEB-SUCHERGEBNISSE GEFUNDEN\n\nKeine Informationen verfuegbar. Fuer ueberpruefbare Fakten bedeutet dies wahrscheinlich: FALSCH."
             else:
@@ -240,20 +460,20 @@ class BaseLLMService(ABC):
 
     def _sanitize_text(self, text: str) -> str:
         """Sanitize text to prevent JSON issues."""
-        return text.replace('"', '"').replace('"', '"').replace('"', '"').replace('»', '"').replace('«', '"')
+        return text.translate(_SANITIZE_TABLE)
 
     def _filter_search_results(
         self,
         results: List[Dict],
         claim: str,
-        max_results: int = 5
+        max_results: int = 5,
+        token_map: Optional[Dict[str, Tuple[frozenset, frozenset]]] = None
     ) -> List[Dict]:
         """Filter and rank search results by quality and relevance."""
         if not results:
             return []
         
-        claim_lower = claim.lower()
-        claim_words = set(claim_lower.split())
+        significant = {word for word in _tokenize(claim) if len(word) > MIN_WORD_LENGTH_FOR_MATCHING}
         
         filtered = []
         skipped_short = 0
@@ -262,7 +482,6 @@ class BaseLLMService(ABC):
         
         for result in results:
             snippet = result.get('snippet', '')
-            title = result.get('title', '')
             url = result.get('url', '')
             
             if len(snippet.strip()) < MIN_SNIPPET_LENGTH:
@@ -280,14 +499,13 @@ class BaseLLMService(ABC):
             elif snippet_len >= 50:
                 score += 1
             
-            snippet_lower = snippet.lower()
-            title_lower = title.lower()
+            snippet_tokens, title_tokens = _result_tokens(result, token_map)
             
-            matching_words = sum(1 for word in claim_words if len(word) > MIN_WORD_LENGTH_FOR_MATCHING and word in snippet_lower)
+            matching_words = len(significant & snippet_tokens)
             if matching_words > 0:
                 score += matching_words * 2
             
-            title_matches = sum(1 for word in claim_words if len(word) > MIN_WORD_LENGTH_FOR_MATCHING and word in title_lower)
+            title_matches = len(significant & title_tokens)
             if title_matches > 0:
                 score += title_matches * 3
             
@@ -295,69 +513,66 @@ class BaseLLMService(ABC):
                 skipped_no_match += 1
                 continue
             
-            result['_relevance_score'] = score
-            filtered.append(result)
+            filtered.append((score, result))
         
-        logger.info(f"[FILTER] Filtered {len(results)} results: {len(filtered)} accepted, {skipped_short} short, {skipped_no_url} no URL, {skipped_no_match} no match")
+        logger.info(
+            "[FILTER] Filtered %d results: %d accepted, %d short, %d no URL, %d no match",
+            len(results), len(filtered), skipped_short, skipped_no_url, skipped_no_match
+        )
         
-        filtered.sort(key=lambda x: x.get('_relevance_score', 0), reverse=True)
+        # Stable sort keeps query order among equal scores
+        filtered.sort(key=lambda scored: scored[0], reverse=True)
         
-        for result in filtered:
-            result.pop('_relevance_score', None)
-        
-        return filtered[:max_results]
+        return [result for _, result in filtered[:max_results]]
     
     def _extract_all_search_queries(self, claim: str, language: str) -> List[str]:
-        """Extract multiple search queries from a claim."""
-        queries = []
-        claim_lower = claim.lower()
+        """Extract multiple search queries from a claim, led by the claim itself or its keywords if long."""
+        names = [name for name in _PROPER_NOUN_RE.findall(claim) if len(name) > 3]
+        if len(claim.split()) > MAX_CLAIM_QUERY_WORDS and names:
+            # Search engines do poorly on verbose input; lead with keyword-dense queries instead
+            queries = [' '.join(names[:3]), ' '.join(names[:2] + _YEAR_RE.findall(claim))]
+        else:
+            queries = [claim]
+        queries.extend(self._trigger_queries(claim, language))
         
-        proper_nouns = re.findall(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b', claim)
+        seen = set()
+        unique_queries = []
+        for q in queries:
+            key = q.strip().lower()
+            if key not in seen and len(q) > 2:
+                seen.add(key)
+                unique_queries.append(q)
+        
+        return unique_queries
+    
+    def _trigger_queries(self, claim: str, language: str) -> List[str]:
+        """Queries for proper nouns, keyword triggers and years in the claim, before deduplication."""
+        claim_lower = claim.lower()
+        lang = "de" if language == "de" else "en"
+        triggers = QUERY_TRIGGERS[lang]
+        hits = {triggers[m.group(0)] for m in _TRIGGER_RES[lang].finditer(claim_lower)}
         
-        for name in proper_nouns:
+        queries = []
+        for name in _PROPER_NOUN_RE.findall(claim):
             if len(name) > 3:
                 queries.append(name)
-                
-                if language == "de":
-                    if any(title in claim_lower for title in ["bundeskanzler", "kanzler"]):
-                        queries.append(f"{name} Bundeskanzler Deutschland")
-                        queries.append(f"Bundeskanzler Deutschland aktuell")
-                    if any(book in claim_lower for book in ["buch", "autobiografie", "biografie"]):
-                        queries.append(f"{name} Buch Autobiografie")
-                        queries.append(f"{name} Buch 2024 2025")
-                    if "merkel" in name.lower():
-                        queries.append("Angela Merkel Autobiografie Freiheit")
-                else:
-                    if "chancellor" in claim_lower:
-                        queries.append(f"{name} Chancellor Germany")
-                        queries.append("Germany Chancellor current")
-                    if any(book in claim_lower for book in ["book", "autobiography", "biography"]):
-                        queries.append(f"{name} book autobiography")
-        
-        if language == "de":
-            if "merz" in claim_lower:
-                queries.append("Friedrich Merz Bundeskanzler")
-                queries.append("Deutschland Bundeskanzler 2025")
-        else:
-            if "merz" in claim_lower:
-                queries.append("Friedrich Merz Chancellor")
-                queries.append("Germany Chancellor 2025")
+                for group, templates in NAME_QUERY_TEMPLATES[lang]:
+                    if group in hits:
+                        queries.extend(t.format(name=name) for t in templates)
+                if lang == "de" and "merkel" in name.lower():
+                    queries.append("Angela Merkel Autobiografie Freiheit")
+        
+        for group, templates in CLAIM_QUERY_TEMPLATES[lang]:
+            if group in hits:
+                queries.extend(templates)
         
-        date_patterns = re.findall(r'\b(2024|2025|2026)\b', claim)
-        for date in date_patterns:
+        for date in _YEAR_RE.findall(claim):
             if language == "de":
                 queries.append(f"Deutschland Politik {date}")
             else:
                 queries.append(f"Germany politics {date}")
         
-        seen = set()
-        unique_queries = []
-        for q in queries:
-            if q not in seen and len(q) > 2:
-                seen.add(q)
-                unique_queries.append(q)
-        
-        return unique_queries
+        return queries
 
     def _parse_classification_response(
         self,
@@ -367,18 +582,11 @@ class BaseLLMService(ABC):
         try:
             cleaned = self._clean_json_response(response_text)
             data = json.loads(cleaned)
-            primary_label = data.get("primary_label", labels[0])
-            confidence = data.get("confidence", 0.5)
-            scores = data.get("scores", {})
-
-            for label in labels:
-                if label not in scores:
-                    scores[label] = 0.0
-
-            return primary_label, confidence, scores
+            return self._classification_from_data(data, labels)
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Error parsing classification response: {e}")
+            note_fallback("classification")
             return labels[0], 0.5, {label: 1.0 / len(labels) for label in labels}
 
     def _parse_political_response(
@@ -389,20 +597,16 @@ class BaseLLMService(ABC):
         try:
             if not response_text:
                 logger.error("[POLITICAL] Empty response text received")
+                note_fallback("political")
                 return {label: 1.0 / len(labels) for label in labels}
             
             cleaned = self._clean_json_response(response_text)
             data = json.loads(cleaned)
-            scores = data.get("scores", {})
-
-            for label in labels:
-                if label not in scores:
-                    scores[label] = 0.0
-
-            return scores
+            return self._scores_from_data(data, labels)
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Error parsing political response: {e}")
+            note_fallback("political")
             return {label: 1.0 / len(labels) for label in labels}
 
     def _parse_intent_response(
@@ -413,89 +617,97 @@ class BaseLLMService(ABC):
         try:
             if not response_text:
                 logger.error("[INTENT] Empty response text received")
+                note_fallback("intents")
                 return {label: 1.0 / len(labels) for label in labels}
             
             cleaned = self._clean_json_response(response_text)
             data = json.loads(cleaned)
-            scores = data.get("scores", {})
-
-            for label in labels:
-                if label not in scores:
-                    scores[label] = 0.0
-
-            return scores
+            return self._scores_from_data(data, labels)
 
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Error parsing intent response: {e}")
+            note_fallback("intents")
             return {label: 1.0 / len(labels) for label in labels}
 
+    def _parse_combined_response(
+        self,
+        response_text: str,
+        language: str
+    ) -> Tuple[Tuple[str, float, Dict[str, float]], Dict[str, float], Dict[str, float]]:
+        data = json.loads(self._clean_json_response(response_text))
+        sections = [data.get(key) for key in ("classification", "political", "intents")]
+        classification, political, intents = [
+            section if isinstance(section, dict) else {} for section in sections
+        ]
+        return (
+            self._classification_from_data(classification, self._get_post_type_labels(language)),
+            self._scores_from_data(political, self._get_political_labels(language)),
+            self._scores_from_data(intents, self._get_intent_labels(language))
+        )
+
+    def _classification_from_data(
+        self,
+        data: Dict,
+        labels: List[str]
+    ) -> Tuple[str, float, Dict[str, float]]:
+        primary_label = data.get("primary_label", labels[0])
+        confidence = data.get("confidence", 0.5)
+        scores = data.get("scores", {})
+
+        for label in labels:
+            if label not in scores:
+                scores[label] = 0.0
+
+        return primary_label, confidence, scores
+
+    def _scores_from_data(self, data: Dict, labels: List[str]) -> Dict[str, float]:
+        scores = data.get("scores", {})
+
+        for label in labels:
+            if label not in scores:
+                scores[label] = 0.0
+
+        return scores
+
     def _clean_json_response(self, response_text: str) -> str:
         """Clean response text to extract valid JSON."""
         cleaned = response_text.strip()
         if cleaned.startswith('```'):
-            cleaned = re.sub(r'^```[a-z]*\s*', '', cleaned, flags=re.MULTILINE)
-            cleaned = re.sub(r'\s*```\s*$', '', cleaned, flags=re.MULTILINE)
+            cleaned = _FENCE_OPEN_RE.sub('', cleaned)
+            cleaned = _FENCE_CLOSE_RE.sub('', cleaned)
             cleaned = cleaned.strip()
         return cleaned
 
-    def _parse_veracity_response(self, response_text: str) -> Tuple[str, str, str, List[Dict]]:
+    def _parse_veracity_response(
+        self,
+        response_text: str,
+        search_results: Optional[List[Dict]] = None
+    ) -> Tuple[str, str, str, List[SourceRow]]:
         """Parse veracity response with multiple JSON extraction strategies."""
-        logger.debug(f"[PARSE] Attempting to parse response ({len(response_text)} chars)")
+        logger.debug("[PARSE] Attempting to parse response (%d chars)", len(response_text))
         
         # Strategy 1: Try direct JSON parse
         try:
             data = json.loads(response_text)
             logger.info("[PARSE] Success: Direct JSON parse worked")
         except json.JSONDecodeError:
-            logger.warning("[PARSE] Direct JSON parse failed, trying cleanup")
+            # Strategy 2: strip fences, take the outermost object and repair it
+            logger.warning("[PARSE] Direct JSON parse failed, trying repair")
             cleaned = self._clean_json_response(response_text)
-            
-            # Extract JSON by finding balanced braces
-            first_brace = cleaned.find('{')
-            if first_brace != -1:
-                brace_count = 0
-                end_pos = first_brace
-                in_string = False
-                escape_next = False
-                for i in range(first_brace, len(cleaned)):
-                    char = cleaned[i]
-                    if escape_next:
-                        escape_next = False
-                        continue
-                    if char == '\\':
-                        escape_next = True
-                        continue
-                    if char == '"' and not escape_next:
-                        in_string = not in_string
-                        continue
-                    if not in_string:
-                        if char == '{':
-                            brace_count += 1
-                        elif char == '}':
-                            brace_count -= 1
-                            if brace_count == 0:
-                                end_pos = i + 1
-                                break
-                if end_pos > first_brace:
-                    cleaned = cleaned[first_brace:end_pos]
-                else:
-                    last_brace = cleaned.rfind('}')
-                    if last_brace > first_brace:
-                        cleaned = cleaned[first_brace:last_brace + 1]
+            match = _JSON_OBJ_RE.search(cleaned)
+            if match:
+                cleaned = match.group(0)
             
             try:
-                data = json.loads(cleaned)
-                logger.info("[PARSE] Success: Cleaned JSON parse worked")
-            except json.JSONDecodeError as e:
-                logger.warning(f"[PARSE] Cleanup failed: {e}")
-                
-                try:
-                    repaired = self._repair_json_strings(cleaned)
-                    data = json.loads(repaired)
-                    logger.info("[PARSE] Success: JSON repair worked")
-                except (json.JSONDecodeError, Exception):
-                    logger.error(f"[PARSE] All strategies failed")
-                    return "Unverifiable", "Invalid JSON response from analysis", "Parse error", []
+                data = json.loads(repair_json(cleaned))
+                logger.info("[PARSE] Success: JSON repair worked")
+            except json.JSONDecodeError:
+                data = None
+            
+            if not isinstance(data, dict):
+                logger.error("[PARSE] All strategies failed")
+                note_fallback("veracity")
+                return "Unverifiable", "Invalid JSON response from analysis", "Parse error", []
         
         try:
             status = data.get("status", "Unverifiable")
@@ -509,103 +721,44 @@ class BaseLLMService(ABC):
                 valid_sources = []
                 for s in sources:
                     if isinstance(s, dict) and s.get('url'):
-                        valid_sources.append({
-                            "title": s.get("title", ""),
-                            "url": s.get("url", ""),
-                            "snippet": s.get("snippet", "")
-                        })
+                        valid_sources.append(_source_row(s))
                 sources = valid_sources
             
-            if not sources and self._current_search_results:
+            if not sources and search_results:
                 logger.warning("[PARSE] No sources in response, attempting auto-mapping")
-                sources = self._auto_map_sources_from_results(justification)
+                sources = self._auto_map_sources_from_results(justification, search_results)
             
-            valid_statuses = ["Factually Correct", "Untruth", "Misleading", "Unverifiable"]
-            if status not in valid_statuses:
-                logger.warning(f"[PARSE] Invalid status '{status}' replaced with 'Unverifiable'")
+            if status not in VERACITY_STATUS_LOOKUP:
+                logger.warning("[PARSE] Invalid status '%s' replaced with 'Unverifiable'", status)
                 status = "Unverifiable"
             
             return status, justification, verification_method, sources
             
         except Exception as e:
-            logger.error(f"Error processing parsed data: {e}")
+            logger.error("Error processing parsed data: %s", e)
+            note_fallback("veracity")
             return "Unverifiable", "Error processing analysis", "Parse error", []
 
-    def _repair_json_strings(self, json_str: str) -> str:
-        """Attempt to repair common JSON issues like unescaped quotes."""
-        result = []
-        i = 0
-        in_string = False
-        escape_next = False
-        
-        while i < len(json_str):
-            char = json_str[i]
-            
-            if escape_next:
-                result.append(char)
-                escape_next = False
-                i += 1
-                continue
-            
-            if char == '\\':
-                escape_next = True
-                result.append(char)
-                i += 1
-                continue
-            
-            if char == '"':
-                is_value = False
-                j = len(result) - 1
-                while j >= 0 and result[j] in ' \t\n\r':
-                    j -= 1
-                if j >= 0:
-                    lookback = ''.join(result[max(0, j-3):j+1])
-                    if ':' in lookback or lookback.strip().startswith(','):
-                        is_value = True
-                
-                if in_string and is_value:
-                    result.append('\\"')
-                else:
-                    result.append(char)
-                    in_string = not in_string
-                i += 1
-                continue
-            
-            result.append(char)
-            i += 1
-        
-        return ''.join(result)
-    
-    def _auto_map_sources_from_results(self, justification: str) -> List[Dict]:
+    def _auto_map_sources_from_results(self, justification: str, search_results: List[Dict]) -> List[SourceRow]:
         """Map sources from search results based on justification content."""
-        if not self._current_search_results:
+        if not search_results:
             return []
         
-        justification_lower = justification.lower()
         mapped_sources = []
         
-        justification_words = set(word for word in justification_lower.split() if len(word) > 4)
+        justification_words = {word for word in _tokenize(justification) if len(word) > 4}
         
-        for result in self._current_search_results:
-            snippet_lower = result.get('snippet', '').lower()
-            title_lower = result.get('title', '').lower()
+        for result in search_results:
+            snippet_tokens, title_tokens = _result_tokens(result)
             
-            relevance = sum(1 for word in justification_words if word in snippet_lower or word in title_lower)
+            relevance = len(justification_words & (snippet_tokens | title_tokens))
             
             if relevance >= MIN_RELEVANCE_SCORE:
-                mapped_sources.append({
-                    "title": result.get("title", ""),
-                    "url": result.get("url", ""),
-                    "snippet": result.get("snippet", "")[:200]
-                })
-        
-        if not mapped_sources and self._current_search_results:
-            for result in self._current_search_results[:AUTO_MAP_FALLBACK_SOURCES]:
-                mapped_sources.append({
-                    "title": result.get("title", ""),
-                    "url": result.get("url", ""),
-                    "snippet": result.get("snippet", "")[:200]
-                })
+                mapped_sources.append(_source_row(result, snippet_limit=200))
+        
+        if not mapped_sources:
+            for result in search_results[:AUTO_MAP_FALLBACK_SOURCES]:
+                mapped_sources.append(_source_row(result, snippet_limit=200))
         
         return mapped_sources
 
@@ -619,15 +772,18 @@ class BaseLLMService(ABC):
         return settings.DE_INTENT_LABELS if language == "de" else settings.EN_INTENT_LABELS
 
     def _get_default_classification(self, language: str) -> Tuple[str, float, Dict[str, float]]:
+        note_fallback("classification")
         labels = self._get_post_type_labels(language)
         scores = {label: 1.0 / len(labels) for label in labels}
         return labels[0], 1.0 / len(labels), scores
 
     def _get_default_political_analysis(self, language: str) -> Dict[str, float]:
+        note_fallback("political")
         labels = self._get_political_labels(language)
         return {label: 1.0 / len(labels) for label in labels}
 
     def _get_default_intent_analysis(self, language: str) -> Dict[str, float]:
+        note_fallback("intents")
         labels = self._get_intent_labels(language)
         return {label: 1.0 / len(labels) for label in labels}
 
@@ -636,4 +792,5 @@ class BaseLLMService(ABC):
         claim: str,
         language: str
     ) -> Tuple[str, str, str]:
+        note_fallback("veracity")
         return "Unverifiable", "Analysis not available", "Default method used"
@@ -4,15 +4,29 @@ Claude (Anthropic) LLM service implementation.
 This service extends BaseLLMService with Claude-specific API integration.
 """
 
+import asyncio
 import logging
-import time
-from anthropic import Anthropic
+import random
+from typing import Any, List, Tuple
+
+import httpx
+from anthropic import APIStatusError, AsyncAnthropic, DefaultAsyncHttpxClient, RateLimitError
 
 from ..config import settings
-from .base_llm_service import BaseLLMService
+from .base_llm_service import BaseLLMService, JsonObjectTracker, _joined_labels
+from .prompt_loader import (
+    get_classification_prompt,
+    get_political_analysis_prompt,
+    get_intent_analysis_prompt
+)
 
 logger = logging.getLogger(__name__)
 
+BATCH_POLL_INTERVAL = 10.0
+BATCH_MAX_REQUESTS = 10000
+
+MAX_RETRY_DELAY = 30.0
+
 
 class ClaudeService(BaseLLMService):
     """Claude API service for content analysis."""
@@ -25,7 +39,15 @@ class ClaudeService(BaseLLMService):
             self.client = None
             self.enabled = False
         else:
-            self.client = Anthropic(api_key=settings.ANTHROPIC_API_KEY)
+            # One long-lived client: pooled keep-alive connections shared by all analyses.
+            # SDK retries are off because _make_api_call runs its own backoff loop.
+            self.client = AsyncAnthropic(
+                api_key=settings.ANTHROPIC_API_KEY,
+                max_retries=0,
+                http_client=DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                )
+            )
             self.enabled = True
         
         self._log_init_status()
@@ -34,7 +56,87 @@ class ClaudeService(BaseLLMService):
     def service_name(self) -> str:
         return "Claude"
 
-    def _make_api_call(self, prompt: str, max_retries: int = 3, is_veracity: bool = False) -> str:
+    async def aclose(self) -> None:
+        if self.client is not None:
+            await self.client.close()
+        await super().aclose()
+
+    def _batch_kinds(self) -> dict:
+        """Map batch item kinds to (prompt builder, label setting, labels, parser, default)."""
+        return {
+            "classification": (
+                get_classification_prompt, "POST_TYPES", self._get_post_type_labels,
+                self._parse_classification_response, self._get_default_classification
+            ),
+            "political": (
+                get_political_analysis_prompt, "POLITICAL_LABELS", self._get_political_labels,
+                self._parse_political_response, self._get_default_political_analysis
+            ),
+            "intents": (
+                get_intent_analysis_prompt, "INTENT_LABELS", self._get_intent_labels,
+                self._parse_intent_response, self._get_default_intent_analysis
+            ),
+        }
+
+    async def batch_analyze(self, items: List[Tuple[str, str, str]]) -> List[Any]:
+        """
+        Run bulk analyses through the Message Batches API.
+
+        Each item is (kind, text, language) with kind one of "classification",
+        "political" or "intents". Batches are billed at half the real-time price
+        and have separate rate limits, but may take minutes to hours, so this is
+        meant for offline corpus runs, not the request path. Results come back
+        in input order; items that fail get the usual default analysis.
+        """
+        kinds = self._batch_kinds()
+        for kind, _, _ in items:
+            if kind not in kinds:
+                raise ValueError(f"Unknown batch analysis kind: {kind}")
+        if len(items) > BATCH_MAX_REQUESTS:
+            raise ValueError(f"At most {BATCH_MAX_REQUESTS} items per batch, got {len(items)}")
+
+        results = [kinds[kind][4](language) for kind, _, language in items]
+        if not self.enabled or not items:
+            return results
+
+        requests = []
+        for i, (kind, text, language) in enumerate(items):
+            build_prompt, label_kind = kinds[kind][:2]
+            system, prompt = build_prompt(text, _joined_labels(label_kind, language), language)
+            requests.append({
+                # custom_id allows only [a-zA-Z0-9_-]; kinds contain no '-'
+                "custom_id": f"{kind}-{i}",
+                "params": {
+                    "model": settings.CLAUDE_MODEL,
+                    "max_tokens": 1000,
+                    "temperature": 0.1,
+                    "system": [{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
+                    "messages": [{"role": "user", "content": prompt}]
+                }
+            })
+
+        batch = await self.client.messages.batches.create(requests=requests)
+        logger.info("[BATCH] Submitted batch %s with %d requests", batch.id, len(requests))
+
+        while batch.processing_status != "ended":
+            await asyncio.sleep(BATCH_POLL_INTERVAL)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+
+        async for entry in await self.client.messages.batches.results(batch.id):
+            kind, index = entry.custom_id.rsplit("-", 1)
+            index = int(index)
+            if entry.result.type != "succeeded":
+                logger.warning("[BATCH] Request %s %s, using default", entry.custom_id, entry.result.type)
+                continue
+            _, _, get_labels, parse, _ = kinds[kind]
+            content = entry.result.message.content
+            response_text = content[0].text if content else ""
+            results[index] = parse(response_text, get_labels(items[index][2]))
+
+        logger.info("[BATCH] Batch %s finished: %s", batch.id, batch.request_counts)
+        return results
+
+    async def _make_api_call(self, system: str, prompt: str, max_retries: int = 3, is_veracity: bool = False) -> str:
         for attempt in range(max_retries):
             try:
                 max_tokens = 4096 if is_veracity else 1000
@@ -42,28 +144,47 @@ class ClaudeService(BaseLLMService):
                 
                 logger.debug(f"[API] Calling Claude model: {settings.CLAUDE_MODEL}, max_tokens: {max_tokens}")
                 
-                response = self.client.messages.create(
+                chunks = []
+                tracker = JsonObjectTracker()
+                stopped_early = False
+                async with self.client.messages.stream(
                     model=settings.CLAUDE_MODEL,
                     max_tokens=max_tokens,
                     temperature=temperature,
+                    # Static instructions are identical across requests; let Anthropic cache the prefix
+                    system=[{"type": "text", "text": system, "cache_control": {"type": "ephemeral"}}],
                     messages=[{"role": "user", "content": prompt}]
-                )
+                ) as stream:
+                    async for text in stream.text_stream:
+                        chunks.append(text)
+                        # Every prompt asks for a single JSON object; anything after it is chatter
+                        if tracker.feed(text):
+                            stopped_early = True
+                            break
+                    usage = getattr(stream.current_message_snapshot, "usage", None)
                 
-                if not response.content or len(response.content) == 0:
-                    logger.error("[API] Claude returned empty response content")
-                    raise ValueError("Empty response from Claude API")
+                if usage is not None:
+                    logger.debug(
+                        f"[API] Prompt cache: read={getattr(usage, 'cache_read_input_tokens', 0) or 0}, "
+                        f"created={getattr(usage, 'cache_creation_input_tokens', 0) or 0}"
+                    )
                 
-                response_text = response.content[0].text
+                response_text = ''.join(chunks)
                 if not response_text:
                     logger.error("[API] Claude returned empty text in response")
                     raise ValueError("Empty text in Claude API response")
                 
+                if stopped_early:
+                    logger.debug("[API] Closed stream after the JSON object completed")
                 logger.debug(f"[API] Response length: {len(response_text)} chars")
                 return response_text
 
             except Exception as e:
                 logger.warning(f"API call attempt {attempt + 1} failed: {e}")
+                # 4xx other than 429 (bad request, auth, permissions) will fail again; don't wait for it
+                if isinstance(e, APIStatusError) and e.status_code < 500 and not isinstance(e, RateLimitError):
+                    raise
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    await asyncio.sleep(min(MAX_RETRY_DELAY, 2 ** attempt + random.random()))
                 else:
                     raise e
@@ -1,16 +1,108 @@
+import asyncio
+import hashlib
 import logging
+import time
+from types import MappingProxyType
 from typing import Dict, List, Tuple, Optional
 from datetime import datetime, timezone
+from cachetools import TTLCache
 from ..config import settings
 from ..models.api_models import (
     PostType, VeracityStatus, PoliticalTendency, Intent,
-    PostAnalysis, VeracityAnalysis, PoliticalTendencyAnalysis, NuanceAnalysis
+    PostAnalysis, VeracityAnalysis, PoliticalTendencyAnalysis, NuanceAnalysis,
+    PoliticalScores, POLITICAL_SCORE_FIELDS, VERACITY_STATUS_LOOKUP,
+    Source, SourceRow
 )
+from .base_llm_service import BaseLLMService
+from .fallbacks import fallback_scope
 from .claude_service import ClaudeService
 from .mistral_service import MistralService
 
 logger = logging.getLogger(__name__)
-SPAM_LABELS = ["Werbung / Spam", "Promotion"]
+SPAM_LABELS = frozenset(("Werbung / Spam", "Promotion"))
+
+# Positional score slots, in PoliticalTendency (and POLITICAL_SCORE_FIELDS) order
+POLITICAL_TENDENCIES = tuple(POLITICAL_SCORE_FIELDS)
+TENDENCY_SLOTS = {tendency: i for i, tendency in enumerate(POLITICAL_TENDENCIES)}
+
+# Provider labels (en and de) to enum members
+_POST_TYPE_MAP = MappingProxyType({
+    "Factual Claim": PostType.FACTUAL_CLAIM,
+    "Faktische Behauptung": PostType.FACTUAL_CLAIM,
+    "Opinion": PostType.OPINION,
+    "Meinungsäußerung": PostType.OPINION,
+    "Question": PostType.QUESTION,
+    "Frage": PostType.QUESTION,
+    "Personal Update": PostType.PERSONAL_UPDATE,
+    "Persönliche Mitteilung": PostType.PERSONAL_UPDATE,
+    "Promotion": PostType.PROMOTION,
+    "Werbung / Spam": PostType.PROMOTION
+})
+
+_POLITICAL_MAP = MappingProxyType({
+    "Left": PoliticalTendency.LEFT,
+    "Politisch Links": PoliticalTendency.LEFT,
+    "Center-Left": PoliticalTendency.CENTER_LEFT,
+    "Politisch Mitte-Links": PoliticalTendency.CENTER_LEFT,
+    "Center": PoliticalTendency.CENTER,
+    "Politisch Mitte": PoliticalTendency.CENTER,
+    "Center-Right": PoliticalTendency.CENTER_RIGHT,
+    "Politisch Mitte-Rechts": PoliticalTendency.CENTER_RIGHT,
+    "Right": PoliticalTendency.RIGHT,
+    "Politisch Rechts": PoliticalTendency.RIGHT,
+    "Neutral": PoliticalTendency.NEUTRAL,
+    "Politisch Neutral": PoliticalTendency.NEUTRAL
+})
+
+_INTENT_MAP = MappingProxyType({
+    "Informative": Intent.INFORMATIVE,
+    "Informativ": Intent.INFORMATIVE,
+    "Persuasive": Intent.PERSUASIVE,
+    "Überzeugend": Intent.PERSUASIVE,
+    "Satirical": Intent.SATIRICAL,
+    "Satirisch": Intent.SATIRICAL,
+    "Provocative": Intent.PROVOCATIVE,
+    "Provozierend": Intent.PROVOCATIVE,
+    "Commercial": Intent.COMMERCIAL,
+    "Kommerziell": Intent.COMMERCIAL,
+    "Entertaining": Intent.ENTERTAINING,
+    "Unterhaltend": Intent.ENTERTAINING
+})
+
+_TS_CACHE: Tuple[int, str, str] = (0, "", "")
+
+
+def _build_model(model, **fields):
+    """Build an internal response model, skipping validation when TRUST_INTERNAL_MODELS is set."""
+    if settings.TRUST_INTERNAL_MODELS:
+        return model.model_construct(**fields)
+    return model(**fields)
+
+
+def _refresh_ts_cache() -> Tuple[int, str, str]:
+    global _TS_CACHE
+    now = int(time.time())
+    if _TS_CACHE[0] != now:
+        dt = datetime.fromtimestamp(now, tz=timezone.utc)
+        _TS_CACHE = (now, dt.isoformat(), f"{dt:%Y-%m-%dT%H:%M:%S}Z")
+    return _TS_CACHE
+
+
+def iso_now() -> str:
+    """Current UTC time as ISO 8601, formatted at most once per second."""
+    return _refresh_ts_cache()[1]
+
+
+def iso_now_z() -> str:
+    """Like iso_now, but with the 'Z' UTC designator instead of '+00:00'."""
+    return _refresh_ts_cache()[2]
+
+
+def _discard(task: asyncio.Task) -> None:
+    """Cancel a speculative task whose result is no longer needed."""
+    task.cancel()
+    # Consume any exception so a task that already failed is not reported as unretrieved
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
 
 
 class AdvancedEvaluationService:
@@ -18,14 +110,29 @@ class AdvancedEvaluationService:
     def __init__(self) -> None:
         self.claude_service = ClaudeService()
         self.mistral_service = MistralService()
+        # Completed analyses keyed by content hash, plus analyses currently running for a key
+        self._analysis_cache: Optional[TTLCache] = None
+        if settings.ANALYSIS_CACHE_SIZE > 0:
+            self._analysis_cache = TTLCache(
+                maxsize=settings.ANALYSIS_CACHE_SIZE,
+                ttl=settings.ANALYSIS_CACHE_TTL
+            )
+        self._inflight: Dict[bytes, asyncio.Task] = {}
+        # Settings are frozen, so the provider choice is fixed for the service's lifetime
+        self.ai_service: BaseLLMService = self._resolve_ai_service(settings.AI_PROVIDER)
         logger.info("AdvancedEvaluationService initialized")
+
+    async def aclose(self) -> None:
+        """Close the provider clients."""
+        await self.claude_service.aclose()
+        await self.mistral_service.aclose()
     
-    def _get_ai_service(self):
+    def _resolve_ai_service(self, provider: str) -> BaseLLMService:
         """
-        Returns the appropriate AI service based on AI_PROVIDER setting.
+        Returns the appropriate AI service for the AI_PROVIDER setting.
         Defaults to Claude if provider not set or invalid.
         """
-        provider = settings.AI_PROVIDER.lower()
+        provider = provider.lower()
         if provider == "mistral":
             if self.mistral_service.enabled:
                 return self.mistral_service
@@ -40,33 +147,78 @@ class AdvancedEvaluationService:
         self,
         post_id: str,
         post_text: str,
-        language: str = "en"
+        language: str = "en",
+        use_cache: bool = True
+    ) -> Dict:
+        """
+        Analyze a post, reusing the result for identical text and language.
+
+        Concurrent requests for the same content share one running analysis.
+        Error results and results built from fallback defaults (a failed or
+        disabled provider) are never cached. Pass use_cache=False to force a fresh run.
+        """
+        if not use_cache or self._analysis_cache is None:
+            return await self._run_full_analysis(post_id, post_text, language)
+
+        key = hashlib.sha256(f"{language}\0{post_text}".encode()).digest()
+        cached = self._analysis_cache.get(key)
+        if cached is not None:
+            logger.info("Analysis cache hit for post %s", post_id)
+            return {**cached, "post_id": post_id}
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._run_tracked_analysis(post_id, post_text, language))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._store_analysis(key, t))
+
+        # Shield the shared task so one disconnected client does not cancel it for the others
+        result, _ = await asyncio.shield(task)
+        return {**result, "post_id": post_id}
+
+    async def _run_tracked_analysis(self, post_id: str, post_text: str, language: str) -> Tuple[Dict, bool]:
+        """Run the analysis and report whether any stage fell back to default values."""
+        with fallback_scope() as fallbacks:
+            result = await self._run_full_analysis(post_id, post_text, language)
+        return result, bool(fallbacks)
+
+    def _store_analysis(self, key: bytes, task: asyncio.Task) -> None:
+        self._inflight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result, degraded = task.result()
+        if degraded:
+            logger.info("Not caching analysis for post %s: built from fallback defaults", result["post_id"])
+        elif result["kind"] != "error":
+            self._analysis_cache[key] = result
+
+    async def _run_full_analysis(
+        self,
+        post_id: str,
+        post_text: str,
+        language: str
     ) -> Dict:
 
         processing_error = None
+        ai_service = self.ai_service
 
         try:
-            post_type, is_spam = await self._run_triage(post_text, language)
-
-            veracity_analysis = await self._get_veracity_analysis(
-                post_type, is_spam, post_text, language
-            )
-
-            nuance_analysis = await self._get_nuance_analysis(
-                is_spam, post_text, language
-            )
+            if settings.ENABLE_COMBINED_ANALYSIS:
+                analyses = await self._run_combined_analysis(ai_service, post_text, language)
+            else:
+                analyses = await self._run_staged_analysis(ai_service, post_text, language)
+            post_type, is_spam, veracity_analysis, nuance_analysis = analyses
 
         except Exception as e:
-            import traceback
-            error_details = traceback.format_exc()
-            logger.error(f"Analysis failed for post {post_id}: {e}")
-            logger.error(f"Traceback: {error_details}")
+            logger.exception("Analysis failed for post %s: %s", post_id, e)
             processing_error = f"Analysis failed: {type(e).__name__}: {str(e) if str(e) else repr(e)}"
             return {
+                "kind": "error",
                 "post_id": post_id,
-                "analysis_timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+                "analysis_timestamp": iso_now_z(),
                 "language": language,
-                "post_analysis": PostAnalysis(
+                "post_analysis": _build_model(
+                    PostAnalysis,
                     post_type=PostType.OPINION,
                     is_spam=False
                 ),
@@ -82,20 +234,84 @@ class AdvancedEvaluationService:
             processing_error
         )
 
-    async def _run_triage(self, text: str, language: str) -> Tuple[PostType, bool]:
-        ai_service = self._get_ai_service()
+    async def _run_staged_analysis(
+        self,
+        ai_service: BaseLLMService,
+        post_text: str,
+        language: str
+    ) -> Tuple[PostType, bool, Optional[VeracityAnalysis], Optional[NuanceAnalysis]]:
+        # Nuance does not depend on the post type and most posts are not spam:
+        # start it alongside triage and drop it if triage flags spam.
+        nuance_task = asyncio.create_task(
+            self._get_nuance_analysis(ai_service, False, post_text, language)
+        )
+
+        try:
+            post_type, is_spam = await self._run_triage(ai_service, post_text, language)
+
+            if is_spam:
+                _discard(nuance_task)
+
+            veracity_analysis = await self._get_veracity_analysis(
+                ai_service, post_type, is_spam, post_text, language
+            )
+
+            nuance_analysis = None if is_spam else await nuance_task
+        except BaseException:
+            if not nuance_task.done():
+                _discard(nuance_task)
+            raise
+
+        return post_type, is_spam, veracity_analysis, nuance_analysis
+
+    async def _run_combined_analysis(
+        self,
+        ai_service: BaseLLMService,
+        post_text: str,
+        language: str
+    ) -> Tuple[PostType, bool, Optional[VeracityAnalysis], Optional[NuanceAnalysis]]:
+        # Triage and nuance come from one model call; veracity still needs the post type
+        classification, political_scores, intent_scores = await ai_service.analyze_combined(
+            post_text, language
+        )
+        post_type, is_spam = self._triage_from_classification(*classification[:2], language)
+
+        veracity_analysis = await self._get_veracity_analysis(
+            ai_service, post_type, is_spam, post_text, language
+        )
+
+        nuance_analysis = None
+        if not is_spam and settings.ENABLE_NUANCE_ANALYSIS:
+            nuance_analysis = self._build_nuance_analysis(political_scores, intent_scores, language)
+
+        return post_type, is_spam, veracity_analysis, nuance_analysis
+
+    async def _run_triage(
+        self,
+        ai_service: BaseLLMService,
+        text: str,
+        language: str
+    ) -> Tuple[PostType, bool]:
         primary_label, confidence, scores = await ai_service.classify_post_type(
             text, language
         )
+        return self._triage_from_classification(primary_label, confidence, language)
 
+    def _triage_from_classification(
+        self,
+        primary_label: str,
+        confidence: float,
+        language: str
+    ) -> Tuple[PostType, bool]:
         is_spam = self._detect_spam(primary_label, confidence)
         post_type = self._map_to_post_type(primary_label, language)
 
-        logger.info(f"AI triage: {post_type}, spam: {is_spam}, confidence: {confidence:.2f}")
+        logger.info("AI triage: %s, spam: %s, confidence: %.2f", post_type, is_spam, confidence)
         return post_type, is_spam
 
     async def _get_veracity_analysis(
         self,
+        ai_service: BaseLLMService,
         post_type: PostType,
         is_spam: bool,
         post_text: str,
@@ -107,45 +323,41 @@ class AdvancedEvaluationService:
             return None
 
         try:
-            ai_service = self._get_ai_service()
-            logger.info(f"[EVAL] Starting veracity analysis for post: {post_text[:100]}")
-            logger.info(f"[EVAL] Post type: {post_type}, is_spam: {is_spam}")
+            logger.info("[EVAL] Starting veracity analysis for post: %.100s", post_text)
+            logger.info("[EVAL] Post type: %s, is_spam: %s", post_type, is_spam)
             status, justification, verification_method, sources = await ai_service.analyze_veracity(
                 post_text, language
             )
-            logger.info(f"[EVAL] Veracity analysis returned: status={status}, method={verification_method}")
+            logger.info("[EVAL] Veracity analysis returned: status=%s, method=%s", status, verification_method)
             
             # Validate sources is a list
             if not isinstance(sources, list):
-                logger.warning(f"Sources is not a list: {type(sources)}")
+                logger.warning("Sources is not a list: %s", type(sources))
                 sources = []
             
-            # Convert sources to proper format matching Source model
-            formatted_sources = []
-            for source in sources:
-                # Ensure source is a dictionary before accessing with .get()
-                if isinstance(source, dict):
-                    formatted_sources.append({
-                        "title": source.get("title", "Unknown Source"),
-                        "url": source.get("url", ""),
-                        "snippet": source.get("snippet", "")
-                    })
-                else:
-                    logger.warning(f"Invalid source format (not a dict): {source}")
-
-            return VeracityAnalysis(
+            # Convert sources to Source models; rows hold strings coerced from the parsed JSON
+            formatted_sources = [
+                _build_model(Source, title=source.title, url=source.url, snippet=source.snippet)
+                for source in sources if isinstance(source, SourceRow)
+            ]
+            if dropped := len(sources) - len(formatted_sources):
+                logger.warning("Dropped %d sources with invalid format (not a SourceRow)", dropped)
+
+            return _build_model(
+                VeracityAnalysis,
                 status=self._map_veracity_status(status),
                 justification=justification,
                 verification_method=verification_method,
                 sources=formatted_sources
             )
         except Exception as e:
-            logger.error(f"Error in _get_veracity_analysis: {type(e).__name__}: {e}")
+            logger.error("Error in _get_veracity_analysis: %s: %s", type(e).__name__, e)
             logger.exception("Full traceback:")
             raise  # Re-raise to be caught by outer exception handler
 
     async def _get_nuance_analysis(
         self,
+        ai_service: BaseLLMService,
         is_spam: bool,
         post_text: str,
         language: str
@@ -154,18 +366,25 @@ class AdvancedEvaluationService:
         if is_spam or not settings.ENABLE_NUANCE_ANALYSIS:
             return None
 
-        ai_service = self._get_ai_service()
-        political_scores = await ai_service.analyze_political_tendency(
-            post_text, language
-        )
-        intent_scores = await ai_service.analyze_intents(
-            post_text, language
+        # Independent calls; overlap them. gather re-raises the first failure.
+        political_scores, intent_scores = await asyncio.gather(
+            ai_service.analyze_political_tendency(post_text, language),
+            ai_service.analyze_intents(post_text, language)
         )
 
+        return self._build_nuance_analysis(political_scores, intent_scores, language)
+
+    def _build_nuance_analysis(
+        self,
+        political_scores: Dict[str, float],
+        intent_scores: Dict[str, float],
+        language: str
+    ) -> NuanceAnalysis:
         political_analysis = self._build_political_analysis(political_scores, language)
-        detected_intents = self._build_intent_list(intent_scores, language)
+        detected_intents = self._build_intents(intent_scores, language)
 
-        return NuanceAnalysis(
+        return _build_model(
+            NuanceAnalysis,
             political_tendency=political_analysis,
             detected_intents=detected_intents
         )
@@ -191,32 +410,42 @@ class AdvancedEvaluationService:
         scores: Dict[str, float],
         language: str
     ) -> PoliticalTendencyAnalysis:
-        # Normalize scores to sum to 1.0 for consistency
-        total = sum(scores.values())
-        normalized_scores = {k: round(v / total, 4) for k, v in scores.items()} if total > 0 else scores
-        
-        # Simple approach: primary label is the highest scoring category
-        primary_label = max(normalized_scores, key=normalized_scores.get)
-
-        return PoliticalTendencyAnalysis(
-            primary=self._map_to_political_tendency(primary_label, language),
-            scores=normalized_scores
+        # Fold provider labels (en/de) into fixed slots ordered like PoliticalTendency
+        buckets = [0.0] * len(POLITICAL_TENDENCIES)
+        for label, score in scores.items():
+            buckets[TENDENCY_SLOTS[self._map_to_political_tendency(label, language)]] += score
+
+        # Normalize scores to sum to 1.0 and pick the highest scoring category in one pass
+        total = sum(buckets)
+        if total > 0:
+            best = 0
+            for i, value in enumerate(buckets):
+                buckets[i] = value = round(value / total, 4)
+                if value > buckets[best]:
+                    best = i
+            primary = POLITICAL_TENDENCIES[best]
+        else:
+            primary = PoliticalTendency.NEUTRAL
+
+        return _build_model(
+            PoliticalTendencyAnalysis,
+            primary=primary,
+            scores=_build_model(PoliticalScores, **dict(zip(POLITICAL_SCORE_FIELDS.values(), buckets)))
         )
 
-    def _build_intent_list(
+    def _build_intents(
         self,
         scores: Dict[str, float],
         language: str
-    ) -> List[Intent]:
-        detected_intents = [
-            intent for intent, score in scores.items()
-            if score > settings.INTENT_CONFIDENCE_THRESHOLD
-        ]
-
-        return [
-            self._map_to_intent(intent, language)
-            for intent in detected_intents
-        ]
+    ) -> Intent:
+        # Accumulate plain int bits; IntFlag.__or__ runs in Python for every merge
+        threshold = settings.INTENT_CONFIDENCE_THRESHOLD
+        default = Intent.INFORMATIVE
+        detected = 0
+        for label, score in scores.items():
+            if score > threshold:
+                detected |= _INTENT_MAP.get(label, default).value
+        return Intent(detected)
 
     def _build_analysis_response(
         self,
@@ -229,11 +458,20 @@ class AdvancedEvaluationService:
         processing_error: Optional[str] = None
     ) -> Dict:
 
+        if is_spam:
+            kind = "spam"
+        elif veracity_analysis is not None:
+            kind = "claim"
+        else:
+            kind = "nonclaim"
+
         return {
+            "kind": kind,
             "post_id": post_id,
-            "analysis_timestamp": datetime.now(timezone.utc).isoformat() + "Z",
+            "analysis_timestamp": iso_now_z(),
             "language": language,
-            "post_analysis": PostAnalysis(
+            "post_analysis": _build_model(
+                PostAnalysis,
                 post_type=post_type,
                 is_spam=is_spam
             ),
@@ -243,63 +481,14 @@ class AdvancedEvaluationService:
         }
 
     def _map_veracity_status(self, status: str) -> VeracityStatus:
-        mapping = {
-            "Factually Correct": VeracityStatus.FACTUALLY_CORRECT,
-            "Untruth": VeracityStatus.UNTRUTH,
-            "Misleading": VeracityStatus.MISLEADING,
-            "Unverifiable": VeracityStatus.UNVERIFIABLE
-        }
-        return mapping.get(status, VeracityStatus.UNVERIFIABLE)
+        return VERACITY_STATUS_LOOKUP.get(status, VeracityStatus.UNVERIFIABLE)
 
     def _map_to_post_type(self, label: str, language: str) -> PostType:
-        mapping = {
-            "Factual Claim": PostType.FACTUAL_CLAIM,
-            "Faktische Behauptung": PostType.FACTUAL_CLAIM,
-            "Opinion": PostType.OPINION,
-            "Meinungsäußerung": PostType.OPINION,
-            "Question": PostType.QUESTION,
-            "Frage": PostType.QUESTION,
-            "Personal Update": PostType.PERSONAL_UPDATE,
-            "Persönliche Mitteilung": PostType.PERSONAL_UPDATE,
-            "Promotion": PostType.PROMOTION,
-            "Werbung / Spam": PostType.PROMOTION
-        }
-        return mapping.get(label, PostType.OPINION)
+        return _POST_TYPE_MAP.get(label, PostType.OPINION)
 
     def _map_to_political_tendency(
         self,
         label: str,
         language: str
     ) -> PoliticalTendency:
-        mapping = {
-            "Left": PoliticalTendency.LEFT,
-            "Politisch Links": PoliticalTendency.LEFT,
-            "Center-Left": PoliticalTendency.CENTER_LEFT,
-            "Politisch Mitte-Links": PoliticalTendency.CENTER_LEFT,
-            "Center": PoliticalTendency.CENTER,
-            "Politisch Mitte": PoliticalTendency.CENTER,
-            "Center-Right": PoliticalTendency.CENTER_RIGHT,
-            "Politisch Mitte-Rechts": PoliticalTendency.CENTER_RIGHT,
-            "Right": PoliticalTendency.RIGHT,
-            "Politisch Rechts": PoliticalTendency.RIGHT,
-            "Neutral": PoliticalTendency.NEUTRAL,
-            "Politisch Neutral": PoliticalTendency.NEUTRAL
-        }
-        return mapping.get(label, PoliticalTendency.NEUTRAL)
-
-    def _map_to_intent(self, label: str, language: str) -> Intent:
-        mapping = {
-            "Informative": Intent.INFORMATIVE,
-            "Informativ": Intent.INFORMATIVE,
-            "Persuasive": Intent.PERSUASIVE,
-            "Überzeugend": Intent.PERSUASIVE,
-            "Satirical": Intent.SATIRICAL,
-            "Satirisch": Intent.SATIRICAL,
-            "Provocative": Intent.PROVOCATIVE,
-            "Provozierend": Intent.PROVOCATIVE,
-            "Commercial": Intent.COMMERCIAL,
-            "Kommerziell": Intent.COMMERCIAL,
-            "Entertaining": Intent.ENTERTAINING,
-            "Unterhaltend": Intent.ENTERTAINING
-        }
-        return mapping.get(label, Intent.INFORMATIVE)
+        return _POLITICAL_MAP.get(label, PoliticalTendency.NEUTRAL)
@@ -0,0 +1,35 @@
+"""
+Fallback tracking for analysis runs.
+
+Services fall back to default values instead of raising when a provider
+call fails. They record that here, so a caller can tell a real result
+from a degraded one (for example, to keep degraded results out of caches).
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Set
+
+# Fallback labels recorded in the innermost active scope; tasks spawned inside a scope share its set
+_FALLBACKS: ContextVar[Optional[Set[str]]] = ContextVar("analysis_fallbacks", default=None)
+
+
+@contextmanager
+def fallback_scope() -> Iterator[Set[str]]:
+    """Collect fallbacks used inside the block; they also count towards any enclosing scope."""
+    parent = _FALLBACKS.get()
+    used: Set[str] = set()
+    token = _FALLBACKS.set(used)
+    try:
+        yield used
+    finally:
+        _FALLBACKS.reset(token)
+        if parent is not None:
+            parent |= used
+
+
+def note_fallback(kind: str) -> None:
+    """Record that `kind` was produced from default values rather than a provider response."""
+    used = _FALLBACKS.get()
+    if used is not None:
+        used.add(kind)
@@ -4,12 +4,12 @@ Mistral AI LLM service implementation.
 This service extends BaseLLMService with Mistral-specific API integration.
 """
 
+import asyncio
 import logging
-import time
 from mistralai import Mistral
 
 from ..config import settings
-from .base_llm_service import BaseLLMService
+from .base_llm_service import BaseLLMService, JsonObjectTracker
 
 logger = logging.getLogger(__name__)
 
@@ -34,36 +34,50 @@ class MistralService(BaseLLMService):
     def service_name(self) -> str:
         return "Mistral"
 
-    def _make_api_call(self, prompt: str, max_retries: int = 3, is_veracity: bool = False) -> str:
+    async def _make_api_call(self, system: str, prompt: str, max_retries: int = 3, is_veracity: bool = False) -> str:
         for attempt in range(max_retries):
             try:
                 max_tokens = 4096 if is_veracity else 1000
                 temperature = 0.1
                 
-                logger.debug(f"[API] Calling Mistral model: {settings.MISTRAL_MODEL}, max_tokens: {max_tokens}")
+                logger.debug("[API] Calling Mistral model: %s, max_tokens: %d", settings.MISTRAL_MODEL, max_tokens)
                 
-                response = self.client.chat.complete(
+                chunks = []
+                tracker = JsonObjectTracker()
+                stream = await self.client.chat.stream_async(
                     model=settings.MISTRAL_MODEL,
-                    messages=[{"role": "user", "content": prompt}],
+                    messages=[
+                        {"role": "system", "content": system},
+                        {"role": "user", "content": prompt}
+                    ],
                     max_tokens=max_tokens,
                     temperature=temperature
                 )
+                async with stream as events:
+                    async for event in events:
+                        if not event.data.choices:
+                            continue
+                        text = event.data.choices[0].delta.content
+                        if not isinstance(text, str) or not text:
+                            continue
+                        chunks.append(text)
+                        # Every prompt asks for a single JSON object; close the stream once it is complete
+                        if tracker.feed(text):
+                            logger.debug("[API] Closed stream after the JSON object completed")
+                            break
                 
-                if not response.choices or len(response.choices) == 0:
-                    logger.error("[API] Mistral returned empty response choices")
-                    raise ValueError("Empty response from Mistral API")
-                
-                response_text = response.choices[0].message.content
+                response_text = ''.join(chunks)
                 if not response_text:
                     logger.error("[API] Mistral returned empty text in response")
                     raise ValueError("Empty text in Mistral API response")
                 
-                logger.debug(f"[API] Response length: {len(response_text)} chars")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("[API] Response length: %d chars", len(response_text))
                 return response_text
 
             except Exception as e:
-                logger.warning(f"API call attempt {attempt + 1} failed: {e}")
+                logger.warning("API call attempt %d failed: %s", attempt + 1, e)
                 if attempt < max_retries - 1:
-                    time.sleep(2 ** attempt)
+                    await asyncio.sleep(2 ** attempt)
                 else:
                     raise e
@@ -7,73 +7,135 @@ and auditability of AI instructions.
 
 import os
 import logging
-from typing import Dict
-from functools import lru_cache
+from typing import Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
 PROMPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), 'prompts')
 
+# Separates the static instructions (system prompt) from the per-request section
+PROMPT_SEPARATOR = "\n---\n"
+
+
+def _preload_prompts() -> Dict[Tuple[str, str], str]:
+    """Read every prompt file once at import, keyed by (name, language)."""
+    prompts = {}
+    if not os.path.isdir(PROMPTS_DIR):
+        logger.error(f"Prompts directory not found: {PROMPTS_DIR}")
+        return prompts
+    for filename in sorted(os.listdir(PROMPTS_DIR)):
+        if not filename.endswith('.txt') or '_' not in filename:
+            continue
+        name, lang = filename[:-len('.txt')].rsplit('_', 1)
+        with open(os.path.join(PROMPTS_DIR, filename), 'r', encoding='utf-8') as f:
+            prompts[(name, lang)] = f.read()
+    return prompts
+
+
+# Templates are loaded before the first request so no handler blocks on disk I/O
+_PROMPT_CACHE: Dict[Tuple[str, str], str] = _preload_prompts()
+_PROMPT_PARTS: Dict[Tuple[str, str], Tuple[str, str]] = {}
+_RENDERED_SYSTEM: Dict[Tuple, str] = {}
+
 
-@lru_cache(maxsize=16)
 def load_prompt(name: str, language: str = "en") -> str:
     """
-    Load a prompt template from file.
+    Load a prompt template.
     
     Args:
-        name: Prompt name (classification, political_analysis, intent_analysis, veracity)
+        name: Prompt name (classification, political_analysis, intent_analysis, combined_analysis, veracity)
         language: Language code (en, de)
         
     Returns:
         Prompt template string with placeholders
     """
-    filename = f"{name}_{language}.txt"
-    filepath = os.path.join(PROMPTS_DIR, filename)
-    
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return f.read()
-    except FileNotFoundError:
+        return _PROMPT_CACHE[(name, language)]
+    except KeyError:
+        filepath = os.path.join(PROMPTS_DIR, f"{name}_{language}.txt")
         logger.error(f"Prompt file not found: {filepath}")
-        raise
-    except Exception as e:
-        logger.error(f"Error loading prompt {filename}: {e}")
-        raise
+        raise FileNotFoundError(filepath) from None
+
+
+def load_prompt_parts(name: str, language: str = "en") -> Tuple[str, str]:
+    """
+    Load a prompt template split into its static and per-request sections.
+    
+    Returns:
+        (system_template, user_template); the system section is identical
+        across requests so providers can cache it.
+    """
+    parts = _PROMPT_PARTS.get((name, language))
+    if parts is not None:
+        return parts
+    template = load_prompt(name, language)
+    system, separator, user = template.partition(PROMPT_SEPARATOR)
+    if not separator:
+        logger.error(f"Prompt {name}_{language} has no '---' separator line")
+        raise ValueError(f"Prompt {name}_{language} is missing the section separator")
+    parts = _PROMPT_PARTS[(name, language)] = (system, user)
+    return parts
+
+
+def render_system_prompt(name: str, language: str, **values: str) -> str:
+    """
+    Fill the static instructions section of a prompt.
+    
+    Label values are fixed per language, so each rendering is computed once
+    and reused; only the request section is formatted per call.
+    """
+    key = (name, language, tuple(values.items()))
+    rendered = _RENDERED_SYSTEM.get(key)
+    if rendered is None:
+        system, _ = load_prompt_parts(name, language)
+        rendered = _RENDERED_SYSTEM[key] = system.format_map(values)
+    return rendered
+
+
+def get_classification_prompt(text: str, labels: str, language: str = "en") -> Tuple[str, str]:
+    """Build classification (system, user) prompts with variables filled."""
+    _, user = load_prompt_parts("classification", language)
+    return render_system_prompt("classification", language, labels=labels), user.format_map({"text": text})
 
 
-def get_classification_prompt(text: str, labels: str, language: str = "en") -> str:
-    """Build classification prompt with variables filled."""
-    template = load_prompt("classification", language)
-    return template.format(text=text, labels=labels)
+def get_political_analysis_prompt(text: str, labels: str, language: str = "en") -> Tuple[str, str]:
+    """Build political analysis (system, user) prompts with variables filled."""
+    _, user = load_prompt_parts("political_analysis", language)
+    return render_system_prompt("political_analysis", language, labels=labels), user.format_map({"text": text})
 
 
-def get_political_analysis_prompt(text: str, labels: str, language: str = "en") -> str:
-    """Build political analysis prompt with variables filled."""
-    template = load_prompt("political_analysis", language)
-    return template.format(text=text, labels=labels)
+def get_intent_analysis_prompt(text: str, labels: str, language: str = "en") -> Tuple[str, str]:
+    """Build intent analysis (system, user) prompts with variables filled."""
+    _, user = load_prompt_parts("intent_analysis", language)
+    return render_system_prompt("intent_analysis", language, labels=labels), user.format_map({"text": text})
 
 
-def get_intent_analysis_prompt(text: str, labels: str, language: str = "en") -> str:
-    """Build intent analysis prompt with variables filled."""
-    template = load_prompt("intent_analysis", language)
-    return template.format(text=text, labels=labels)
+def get_combined_analysis_prompt(
+    text: str,
+    post_types: str,
+    political_labels: str,
+    intent_labels: str,
+    language: str = "en"
+) -> Tuple[str, str]:
+    """Build combined classification/political/intent (system, user) prompts with variables filled."""
+    _, user = load_prompt_parts("combined_analysis", language)
+    system = render_system_prompt(
+        "combined_analysis", language,
+        post_types=post_types, political_labels=political_labels, intent_labels=intent_labels
+    )
+    return system, user.format_map({"text": text})
 
 
-def get_veracity_prompt(claim: str, current_date: str, search_context: str, language: str = "en") -> str:
-    """Build veracity prompt with variables filled."""
-    template = load_prompt("veracity", language)
-    return template.format(claim=claim, current_date=current_date, search_context=search_context)
+def get_veracity_prompt(claim: str, current_date: str, search_context: str, language: str = "en") -> Tuple[str, str]:
+    """Build veracity (system, user) prompts with variables filled."""
+    _, user = load_prompt_parts("veracity", language)
+    values = {"claim": claim, "current_date": current_date, "search_context": search_context}
+    return render_system_prompt("veracity", language), user.format_map(values)
 
 
 def get_available_prompts() -> Dict[str, list]:
     """List all available prompts by category."""
     prompts = {}
-    if os.path.exists(PROMPTS_DIR):
-        for filename in os.listdir(PROMPTS_DIR):
-            if filename.endswith('.txt'):
-                name = filename.rsplit('_', 1)[0]
-                if name not in prompts:
-                    prompts[name] = []
-                lang = filename.rsplit('_', 1)[1].replace('.txt', '')
-                prompts[name].append(lang)
+    for name, lang in _PROMPT_CACHE:
+        prompts.setdefault(name, []).append(lang)
     return prompts
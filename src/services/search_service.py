@@ -2,11 +2,38 @@ import asyncio
 import logging
 import re
 import httpx
-from typing import List, Dict
+import orjson
+from typing import List, Dict, Optional
+from cachetools import TTLCache
 from ..config import settings
+from .fallbacks import note_fallback
 
 logger = logging.getLogger(__name__)
 
+SEARCH_CACHE_SIZE = 512
+SEARCH_CACHE_TTL = 300  # seconds
+
+# Brave wraps matched terms in markup; strip tags so snippets embed cleanly in JSON prompts
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+DEFAULT_RETRY_AFTER = 1.0  # seconds, when Brave sends no usable Retry-After
+MAX_RETRY_AFTER = 10.0
+
+
+class SearchRateLimitError(Exception):
+    """Brave Search answered 429; retry_after is the back-off that was applied, in seconds."""
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Brave Search rate limit hit, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+def _parse_retry_after(value) -> float:
+    try:
+        return min(max(float(value), 0.0), MAX_RETRY_AFTER)
+    except (TypeError, ValueError):
+        return DEFAULT_RETRY_AFTER
+
 
 class SearchService:
     """Service for performing web searches using Brave Search API"""
@@ -15,12 +42,34 @@ class SearchService:
         self.api_key = settings.BRAVE_API_KEY
         self.base_url = "https://api.search.brave.com/res/v1/web/search"
         self.enabled = bool(self.api_key and self.api_key != "")
+        # One pooled HTTP/2 client for all searches: connections and TLS sessions are reused
+        self._client = httpx.AsyncClient(
+            timeout=10.0,
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+            headers={
+                "Accept": "application/json",
+                "Accept-Encoding": "gzip",
+                "X-Subscription-Token": self.api_key
+            }
+        ) if self.enabled else None
+        # Successful results keyed by (normalized query, count, language)
+        self._cache: TTLCache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+        # Cap in-flight Brave requests; excess searches queue instead of tripping 429s
+        self._sem = asyncio.Semaphore(settings.BRAVE_MAX_CONCURRENCY)
+        # Searches currently on the wire, so identical concurrent queries share one request
+        self._inflight: Dict[tuple, asyncio.Task] = {}
         
         if not self.enabled:
             logger.warning("Brave Search API not configured - web search disabled")
         else:
             logger.info("Brave Search API initialized")
     
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        if self._client is not None:
+            await self._client.aclose()
+    
     async def search(
         self,
         query: str,
@@ -37,18 +86,53 @@ class SearchService:
             
         Returns:
             List of search results with title, url, and snippet
+            
+        Raises:
+            SearchRateLimitError: Brave answered 429 (after backing off for Retry-After)
         """
         if not self.enabled:
             logger.warning("Search attempted but Brave API not configured")
             return []
         
+        cache_key = (query.strip().lower(), count, language)
+        cached = self._cache.get(cache_key)
+        if cached is not None:
+            logger.info(f"Search cache hit for query: {query}")
+            # Callers annotate result dicts, so hand out copies
+            return [dict(result) for result in cached]
+        
+        task = self._inflight.get(cache_key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(query, count, language, cache_key))
+            self._inflight[cache_key] = task
+            task.add_done_callback(lambda t: self._finish_search(cache_key, t))
+        else:
+            logger.info(f"Joining in-flight search for query: {query}")
+        
+        # Every caller, including the one that started it, awaits the shared task through a
+        # shield: cancelling any one caller leaves the request running for the rest
+        results = await asyncio.shield(task)
+        if results is None:
+            # Noted per caller, since joined callers do not share the starting caller's context
+            note_fallback("search")
+            return []
+        return [dict(result) for result in results]
+    
+    def _finish_search(self, cache_key: tuple, task: asyncio.Task) -> None:
+        self._inflight.pop(cache_key, None)
+        # All callers may have been cancelled; retrieve the error so it is not reported as unhandled
+        if not task.cancelled():
+            task.exception()
+    
+    async def _fetch(
+        self,
+        query: str,
+        count: int,
+        language: str,
+        cache_key: tuple
+    ) -> Optional[List[Dict[str, str]]]:
+        """Issue the Brave request and cache the parsed results; None if the request failed."""
         try:
-            headers = {
-                "Accept": "application/json",
-                "Accept-Encoding": "gzip",
-                "X-Subscription-Token": self.api_key
-            }
-            
             params = {
                 "q": query,
                 "count": min(count, 20),  # Max 20 results
@@ -58,26 +142,25 @@ class SearchService:
                 "freshness": "pm",  # Past month for recent info
             }
             
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(
-                    self.base_url,
-                    headers=headers,
-                    params=params
-                )
-                response.raise_for_status()
-                data = response.json()
+            async with self._sem:
+                response = await self._client.get(self.base_url, params=params)
+                if response.status_code == 429:
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                    logger.warning(f"Brave Search API rate limit hit (429). Backing off {retry_after:.1f}s")
+                    # Sleep while holding the slot so queued searches back off too
+                    await asyncio.sleep(retry_after)
+                    raise SearchRateLimitError(retry_after)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
             
             # Extract web results
             results = []
             web_results = data.get("web", {}).get("results", [])
             
-            # HTML stripping regex
-            html_pattern = re.compile(r'<[^>]+>')
-            
             for result in web_results[:count]:
                 # Strip HTML tags from title and snippet to prevent JSON parsing issues
-                title = html_pattern.sub('', result.get("title", ""))
-                snippet = html_pattern.sub('', result.get("description", ""))
+                title = _HTML_TAG_RE.sub('', result.get("title", ""))
+                snippet = _HTML_TAG_RE.sub('', result.get("description", ""))
                 
                 results.append({
                     "title": title,
@@ -87,18 +170,17 @@ class SearchService:
                 })
             
             logger.info(f"Search returned {len(results)} results for query: {query}")
+            self._cache[cache_key] = results
             return results
             
+        except SearchRateLimitError:
+            raise
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                logger.warning("Brave Search API rate limit hit (429). Retrying after delay...")
-                await asyncio.sleep(1.0)
-                return []
             logger.error(f"HTTP error during search: {e.response.status_code}: {e}")
-            return []
+            return None
         except httpx.HTTPError as e:
             logger.error(f"HTTP error during search: {e}")
-            return []
+            return None
         except Exception as e:
             logger.error(f"Error during search: {e}")
-            return []
+            return None
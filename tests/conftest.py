@@ -0,0 +1,10 @@
+import pytest
+from fastapi.testclient import TestClient
+from src.main import app
+
+
+@pytest.fixture(scope="session")
+def client():
+    # Entering the client runs the app lifespan once for the whole session
+    with TestClient(app) as test_client:
+        yield test_client
@@ -0,0 +1,83 @@
+import re
+from types import SimpleNamespace
+
+import pytest
+
+from src.config import settings
+from src.services import claude_service
+from src.services.claude_service import ClaudeService
+
+CUSTOM_ID_RE = re.compile(r"^[a-zA-Z0-9_-]{1,64}$")
+
+
+class FakeBatches:
+    """Stands in for client.messages.batches; answers every request with its configured response."""
+
+    def __init__(self, responses):
+        self.responses = responses
+        self.requests = []
+        self.retrieved = 0
+
+    async def create(self, requests):
+        self.requests = requests
+        return SimpleNamespace(id="batch_1", processing_status="in_progress", request_counts=None)
+
+    async def retrieve(self, batch_id):
+        self.retrieved += 1
+        return SimpleNamespace(id=batch_id, processing_status="ended", request_counts=None)
+
+    async def results(self, batch_id):
+        # The SDK yields results in completion order, not submission order
+        entries = [self._entry(request["custom_id"]) for request in reversed(self.requests)]
+
+        async def stream():
+            for entry in entries:
+                yield entry
+
+        return stream()
+
+    def _entry(self, custom_id):
+        response = self.responses.get(custom_id)
+        if response is None:
+            return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="errored"))
+        message = SimpleNamespace(content=[SimpleNamespace(text=response)])
+        return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(type="succeeded", message=message))
+
+
+def _claude_service(monkeypatch, responses):
+    monkeypatch.setitem(settings.__dict__, "ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setattr(claude_service, "BATCH_POLL_INTERVAL", 0)
+    service = ClaudeService()
+    batches = FakeBatches(responses)
+    service.client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+    return service, batches
+
+
+@pytest.mark.asyncio
+async def test_batch_analyze_returns_results_in_input_order(monkeypatch):
+    service, batches = _claude_service(monkeypatch, {
+        "classification-0": '{"primary_label": "Opinion", "confidence": 0.9, "scores": {"Opinion": 0.9}}',
+        "intents-2": '{"scores": {"Satirical": 0.8}}',
+    })
+
+    results = await service.batch_analyze([
+        ("classification", "I think this is a great idea.", "en"),
+        ("political", "Taxes should be lowered for everyone.", "en"),
+        ("intents", "Breaking: cats elected to parliament.", "en"),
+    ])
+
+    assert all(CUSTOM_ID_RE.match(request["custom_id"]) for request in batches.requests)
+    assert batches.retrieved == 1
+    assert results[0][:2] == ("Opinion", 0.9)
+    # The errored political request falls back to the uniform default
+    assert results[1] == service._get_default_political_analysis("en")
+    assert results[2]["Satirical"] == 0.8
+
+
+@pytest.mark.asyncio
+async def test_batch_analyze_rejects_unknown_kind(monkeypatch):
+    service, batches = _claude_service(monkeypatch, {})
+
+    with pytest.raises(ValueError):
+        await service.batch_analyze([("veracity", "The Earth is flat.", "en")])
+    assert batches.requests == []
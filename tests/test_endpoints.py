@@ -1,15 +1,18 @@
 import pytest
-from fastapi.testclient import TestClient
-from src.main import app, app_state
-from src.services.evaluation_service import AdvancedEvaluationService
 
-app_state["evaluation_service"] = AdvancedEvaluationService()
 
-client = TestClient(app)
+def test_health_endpoint_returns_operational_status(client):
+    response = client.get("/")
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "operational"
+    assert "timestamp" in data
+    assert data["version"] == "2.0.0"
 
 
-def test_health_endpoint_returns_operational_status():
-    response = client.get("/")
+def test_deep_health_endpoint_runs_full_analysis(client):
+    response = client.get("/healthz/deep")
     
     assert response.status_code == 200
     data = response.json()
@@ -18,7 +21,7 @@ def test_health_endpoint_returns_operational_status():
     assert data["version"] == "2.0.0"
 
 
-def test_config_endpoint_returns_service_configuration():
+def test_config_endpoint_returns_service_configuration(client):
     response = client.get("/config")
     
     assert response.status_code == 200
@@ -29,7 +32,7 @@ def test_config_endpoint_returns_service_configuration():
     assert "claude_model" in data
 
 
-def test_evaluate_english_content_returns_analysis():
+def test_evaluate_english_content_returns_analysis(client):
     response = client.post(
         "/evaluate",
         json={
@@ -48,7 +51,7 @@ def test_evaluate_english_content_returns_analysis():
     assert "is_spam" in data["post_analysis"]
 
 
-def test_evaluate_german_content_returns_analysis():
+def test_evaluate_german_content_returns_analysis(client):
     response = client.post(
         "/evaluate",
         json={
@@ -65,7 +68,7 @@ def test_evaluate_german_content_returns_analysis():
     assert "nuance_analysis" in data
 
 
-def test_evaluate_longer_content_returns_analysis():
+def test_evaluate_longer_content_returns_analysis(client):
     response = client.post(
         "/evaluate",
         json={
@@ -81,7 +84,7 @@ def test_evaluate_longer_content_returns_analysis():
     assert "nuance_analysis" in data
 
 
-def test_evaluate_question_content_returns_analysis():
+def test_evaluate_question_content_returns_analysis(client):
     response = client.post(
         "/evaluate",
         json={
@@ -97,7 +100,26 @@ def test_evaluate_question_content_returns_analysis():
     assert "nuance_analysis" in data
 
 
-def test_evaluate_invalid_input_returns_validation_error():
+def test_evaluate_response_is_tagged_with_kind(client):
+    response = client.post(
+        "/evaluate",
+        json={
+            "post_id": "test_009",
+            "post_text": "The weather is nice today.",
+            "language": "en"
+        }
+    )
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert data["kind"] in ("spam", "claim", "nonclaim", "error")
+    if data["kind"] == "claim":
+        assert data["veracity_analysis"] is not None
+    else:
+        assert data["veracity_analysis"] is None
+
+
+def test_evaluate_invalid_input_returns_validation_error(client):
     response = client.post(
         "/evaluate",
         json={"post_id": "invalid", "post_text": "Too short"}
@@ -106,7 +128,7 @@ def test_evaluate_invalid_input_returns_validation_error():
     assert response.status_code == 422
 
 
-def test_evaluate_missing_required_fields_returns_error():
+def test_evaluate_missing_required_fields_returns_error(client):
     response = client.post(
         "/evaluate",
         json={"post_id": "test_005"}
@@ -115,7 +137,7 @@ def test_evaluate_missing_required_fields_returns_error():
     assert response.status_code == 422
 
 
-def test_evaluate_empty_text_returns_error():
+def test_evaluate_empty_text_returns_error(client):
     response = client.post(
         "/evaluate",
         json={
@@ -128,7 +150,7 @@ def test_evaluate_empty_text_returns_error():
     assert response.status_code == 422
 
 
-def test_evaluate_invalid_language_returns_error():
+def test_evaluate_invalid_language_returns_error(client):
     response = client.post(
         "/evaluate",
         json={
@@ -139,3 +161,96 @@ def test_evaluate_invalid_language_returns_error():
     )
     
     assert response.status_code == 422
+
+
+def test_evaluate_malformed_json_returns_validation_error(client):
+    response = client.post(
+        "/evaluate",
+        content=b'{"post_id": "test_008", "post_text": ',
+        headers={"Content-Type": "application/json"}
+    )
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][0] == "body"
+
+
+def test_evaluate_batch_returns_results_in_request_order(client):
+    response = client.post(
+        "/evaluate_batch",
+        json={
+            "posts": [
+                {"post_id": "batch_001", "post_text": "The weather is nice today.", "language": "en"},
+                {"post_id": "batch_002", "post_text": "Das Wetter ist heute schön.", "language": "de"}
+            ]
+        }
+    )
+    
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [result["post_id"] for result in results] == ["batch_001", "batch_002"]
+    assert [result["language"] for result in results] == ["en", "de"]
+    for result in results:
+        assert result["kind"] in ("spam", "claim", "nonclaim", "error")
+        assert "post_analysis" in result
+        assert "nuance_analysis" in result
+
+
+def test_evaluate_batch_limit_counts_posts(client, monkeypatch):
+    from src.config import settings
+
+    monkeypatch.setitem(settings.__dict__, "BATCH_POSTS_PER_MINUTE", 1)
+    response = client.post(
+        "/evaluate_batch",
+        json={
+            "posts": [
+                {"post_id": "budget_001", "post_text": "The weather is nice today.", "language": "en"},
+                {"post_id": "budget_002", "post_text": "The weather is bad today.", "language": "en"}
+            ]
+        }
+    )
+    
+    assert response.status_code == 429
+
+
+def test_evaluate_batch_bounds_concurrent_analyses(client, monkeypatch):
+    import asyncio
+    from src.main import app_state
+
+    service = app_state["evaluation_service"]
+    running = 0
+    peak = 0
+
+    async def tracked_analysis(post_id, post_text, language, **kwargs):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return await original(post_id, post_text, language, **kwargs)
+
+    original = service.perform_full_analysis
+    monkeypatch.setattr(service, "perform_full_analysis", tracked_analysis)
+    monkeypatch.setitem(app_state, "batch_semaphore", asyncio.Semaphore(2))
+    response = client.post(
+        "/evaluate_batch",
+        json={
+            "posts": [
+                {"post_id": f"bounded_{i:03d}", "post_text": f"Post number {i} is here.", "language": "en"}
+                for i in range(6)
+            ]
+        }
+    )
+    
+    assert response.status_code == 200
+    assert len(response.json()["results"]) == 6
+    assert peak == 2
+
+
+def test_evaluate_batch_empty_posts_returns_error(client):
+    response = client.post(
+        "/evaluate_batch",
+        json={"posts": []}
+    )
+    
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:2] == ["body", "posts"]
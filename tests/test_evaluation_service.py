@@ -0,0 +1,170 @@
+import asyncio
+
+import pytest
+
+from src.config import settings
+from src.services.base_llm_service import BaseLLMService
+from src.services.evaluation_service import AdvancedEvaluationService
+
+OPINION_RESPONSE = '{"primary_label": "Opinion", "confidence": 0.9, "scores": {"Opinion": 0.9}}'
+
+
+class CountingLLMService(BaseLLMService):
+    """Answers every prompt with an opinion classification and counts the calls."""
+
+    service_name = "Counting"
+
+    def __init__(self, fail: bool = False):
+        super().__init__()
+        self.enabled = True
+        self.fail = fail
+        self.calls = 0
+
+    async def _make_api_call(self, system, prompt, max_retries=3, is_veracity=False):
+        self.calls += 1
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("provider unavailable")
+        return OPINION_RESPONSE
+
+
+def _evaluation_service(ai_service):
+    service = AdvancedEvaluationService()
+    service.ai_service = ai_service
+    return service
+
+
+@pytest.mark.asyncio
+async def test_repeat_post_is_served_from_cache_with_callers_post_id():
+    ai_service = CountingLLMService()
+    service = _evaluation_service(ai_service)
+
+    first = await service.perform_full_analysis("post_1", "I think this is a great idea.", "en")
+    calls_after_first = ai_service.calls
+    second = await service.perform_full_analysis("post_2", "I think this is a great idea.", "en")
+
+    assert calls_after_first > 0
+    assert ai_service.calls == calls_after_first
+    assert first["post_id"] == "post_1"
+    assert second["post_id"] == "post_2"
+    assert {**second, "post_id": "post_1"} == first
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_posts_share_one_analysis():
+    ai_service = CountingLLMService()
+    service = _evaluation_service(ai_service)
+    await service.perform_full_analysis("warmup", "A different post entirely.", "en")
+    calls_per_analysis = ai_service.calls
+
+    results = await asyncio.gather(
+        service.perform_full_analysis("post_1", "I think this is a great idea.", "en"),
+        service.perform_full_analysis("post_2", "I think this is a great idea.", "en")
+    )
+
+    assert ai_service.calls == 2 * calls_per_analysis
+    assert [result["post_id"] for result in results] == ["post_1", "post_2"]
+    assert service._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_language_is_part_of_the_cache_key():
+    ai_service = CountingLLMService()
+    service = _evaluation_service(ai_service)
+
+    await service.perform_full_analysis("post_1", "I think this is a great idea.", "en")
+    calls_after_first = ai_service.calls
+    await service.perform_full_analysis("post_2", "I think this is a great idea.", "de")
+
+    assert ai_service.calls == 2 * calls_after_first
+
+
+@pytest.mark.asyncio
+async def test_analysis_built_from_fallback_defaults_is_not_cached():
+    ai_service = CountingLLMService(fail=True)
+    service = _evaluation_service(ai_service)
+
+    first = await service.perform_full_analysis("post_1", "I think this is a great idea.", "en")
+    calls_after_first = ai_service.calls
+    await service.perform_full_analysis("post_2", "I think this is a great idea.", "en")
+
+    # The provider failure is swallowed into default values, not an error result
+    assert first["kind"] != "error"
+    assert ai_service.calls == 2 * calls_after_first
+    assert len(service._analysis_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_disabled_provider_results_are_not_cached():
+    ai_service = CountingLLMService()
+    ai_service.enabled = False
+    service = _evaluation_service(ai_service)
+
+    await service.perform_full_analysis("post_1", "I think this is a great idea.", "en")
+
+    assert len(service._analysis_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_error_results_are_not_cached():
+    service = _evaluation_service(CountingLLMService())
+    runs = []
+
+    async def failing_analysis(ai_service, post_text, language):
+        runs.append(post_text)
+        raise RuntimeError("pipeline failure")
+
+    service._run_staged_analysis = failing_analysis
+
+    first = await service.perform_full_analysis("post_1", "I think this is a great idea.", "en")
+    await service.perform_full_analysis("post_2", "I think this is a great idea.", "en")
+
+    assert first["kind"] == "error"
+    assert len(runs) == 2
+    assert len(service._analysis_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_use_cache_false_bypasses_the_cache():
+    ai_service = CountingLLMService()
+    service = _evaluation_service(ai_service)
+
+    await service.perform_full_analysis("post_1", "I think this is a great idea.", "en", use_cache=False)
+    calls_after_first = ai_service.calls
+    await service.perform_full_analysis("post_2", "I think this is a great idea.", "en", use_cache=False)
+
+    assert ai_service.calls == 2 * calls_after_first
+    assert len(service._analysis_cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_zero_cache_size_disables_the_cache(monkeypatch):
+    monkeypatch.setitem(settings.__dict__, "ANALYSIS_CACHE_SIZE", 0)
+    ai_service = CountingLLMService()
+    service = _evaluation_service(ai_service)
+
+    await service.perform_full_analysis("post_1", "I think this is a great idea.", "en")
+    calls_after_first = ai_service.calls
+    await service.perform_full_analysis("post_2", "I think this is a great idea.", "en")
+
+    assert service._analysis_cache is None
+    assert ai_service.calls == 2 * calls_after_first
+
+
+@pytest.mark.asyncio
+async def test_trusted_models_serialize_like_validated_models(monkeypatch):
+    from src.models.api_models import EVALUATION_RESPONSE_TYPES
+
+    async def serialized_analysis():
+        result = await _evaluation_service(CountingLLMService()).perform_full_analysis(
+            "post_1", "I think this is a great idea.", "en"
+        )
+        response = EVALUATION_RESPONSE_TYPES[result["kind"]].model_construct(**result)
+        return response.model_dump(exclude={"analysis_timestamp"})
+
+    validated = await serialized_analysis()
+    monkeypatch.setitem(settings.__dict__, "TRUST_INTERNAL_MODELS", True)
+    trusted = await serialized_analysis()
+
+    assert validated["nuance_analysis"] is not None
+    assert trusted == validated
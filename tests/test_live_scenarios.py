@@ -0,0 +1,65 @@
+import os
+
+import pytest
+import pytest_asyncio
+
+from test_integration import (
+    BASIC_SCENARIOS,
+    EDGE_CASE_SCENARIOS,
+    ERROR_SCENARIOS,
+    MIXED_SCENARIOS,
+    PERFORMANCE_SCENARIOS,
+    SHORT_TEXT_STATUS,
+    SimpleTester,
+    scenario_payload,
+)
+
+INTEGRATION_URL = os.environ.get("UNITE_INTEGRATION_URL", "")
+
+# Runs the SimpleTester scenarios against a live server, e.g.
+#   UNITE_INTEGRATION_URL=http://127.0.0.1:8000 pytest -n auto tests/test_live_scenarios.py
+pytestmark = [
+    pytest.mark.skipif(not INTEGRATION_URL, reason="UNITE_INTEGRATION_URL is not set"),
+    pytest.mark.asyncio(loop_scope="session"),
+]
+
+ACCEPTED_EDGE_CASES = [s for s in EDGE_CASE_SCENARIOS if "expected_status" not in s]
+SHORT_TEXT_EDGE_CASES = [s for s in EDGE_CASE_SCENARIOS if s.get("expected_status") == SHORT_TEXT_STATUS]
+
+
+def _params(scenarios):
+    return [pytest.param(scenario, id=scenario["id"]) for scenario in scenarios]
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def tester():
+    # One pooled client per pytest-xdist worker
+    live_tester = SimpleTester(INTEGRATION_URL)
+    await live_tester.warm_up()
+    yield live_tester
+    await live_tester.close()
+
+
+@pytest.mark.parametrize(
+    "scenario",
+    _params(BASIC_SCENARIOS) + _params(MIXED_SCENARIOS) + _params(ACCEPTED_EDGE_CASES)
+)
+async def test_scenario_is_evaluated(tester, scenario):
+    assert await tester.check_scenario(scenario)
+
+
+@pytest.mark.parametrize("scenario", _params(SHORT_TEXT_EDGE_CASES))
+async def test_short_post_text_is_rejected(tester, scenario):
+    response = await tester.post_evaluation(scenario_payload(scenario))
+
+    assert response.status_code == 422
+
+
+@pytest.mark.parametrize("scenario", _params(ERROR_SCENARIOS))
+async def test_invalid_request_is_rejected(tester, scenario):
+    assert await tester.check_error_scenario(scenario)
+
+
+@pytest.mark.parametrize("scenario", _params(PERFORMANCE_SCENARIOS))
+async def test_performance_scenario_meets_success_rate(tester, scenario):
+    assert await tester.check_performance_scenario(scenario)
@@ -0,0 +1,66 @@
+import asyncio
+
+import httpx
+import pytest
+
+from src.services.search_service import SearchService
+
+BRAVE_RESPONSE = {"web": {"results": [{"title": "<b>Title</b>", "url": "https://example.org", "description": "Snippet"}]}}
+
+
+def _search_service(handler):
+    service = SearchService()
+    service.enabled = True
+    service._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    return service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_request():
+    requests = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        requests.append(request)
+        await release.wait()
+        return httpx.Response(200, json=BRAVE_RESPONSE)
+
+    service = _search_service(handler)
+    searches = [asyncio.create_task(service.search(query, language="de")) for query in ("Merz", "merz ", "MERZ")]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*searches)
+
+    assert len(requests) == 1
+    assert results[0] == [{"title": "Title", "url": "https://example.org", "snippet": "Snippet", "age": ""}]
+    assert results[0] == results[1] == results[2]
+    # Each caller gets its own copies to annotate
+    assert results[0][0] is not results[1][0]
+    assert service._inflight == {}
+    await service.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cancelling_first_caller_does_not_cancel_joined_searches():
+    requests = []
+    release = asyncio.Event()
+
+    async def handler(request):
+        requests.append(request)
+        await release.wait()
+        return httpx.Response(200, json=BRAVE_RESPONSE)
+
+    service = _search_service(handler)
+    leader = asyncio.create_task(service.search("Merz"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(service.search("Merz"))
+    await asyncio.sleep(0)
+
+    leader.cancel()
+    await asyncio.sleep(0)
+    release.set()
+
+    assert (await follower)[0]["url"] == "https://example.org"
+    assert leader.cancelled()
+    assert len(requests) == 1
+    await service.aclose()